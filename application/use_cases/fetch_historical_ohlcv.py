@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Sequence
+from typing import Iterable, Sequence
 
 from application.policies.timeframe_policy import TimeframePolicy
 from domain.entities.candle import Candle
@@ -36,3 +36,20 @@ class FetchHistoricalOHLCV:
             end=end,
             limit=limit,
         )
+
+    def execute_many(
+        self,
+        symbols: Iterable[str],
+        timeframe: Timeframe,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int | None = None,
+    ) -> dict[str, Sequence[Candle]]:
+        validated_timeframe = self.timeframe_policy.ensure_supported(timeframe)
+        return self.market_data_service.get_many_historical_ohlcv(
+            symbols=symbols,
+            timeframe=validated_timeframe,
+            start=start,
+            end=end,
+            limit=limit,
+        )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Sequence
+from typing import Iterable, Sequence
 
 from application.policies.timeframe_policy import TimeframePolicy
 from domain.entities.candle import Candle
@@ -26,3 +26,11 @@ class FetchLatestOHLCV:
         return self.market_data_service.get_latest_ohlcv(
             symbol=symbol, timeframe=validated_timeframe, count=count
         )
+
+    def execute_many(
+        self, symbols: Iterable[str], timeframe: Timeframe, count: int = 1
+    ) -> dict[str, Sequence[Candle]]:
+        validated_timeframe = self.timeframe_policy.ensure_supported(timeframe)
+        return self.market_data_service.get_many_latest_ohlcv(
+            symbols=symbols, timeframe=validated_timeframe, count=count
+        )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Sequence
+from typing import Callable, Sequence
 
 from application.use_cases.fetch_latest_ohlcv import FetchLatestOHLCV
 from domain.entities.candle import Candle
@@ -21,15 +21,21 @@ class TradingDecision:
 
 
 class GenerateTradingDecision:
-    """Use case to generate trading decisions based on trend analysis."""
+    """
+    Use case to generate trading decisions based on trend analysis.
+
+    TrendDetector accumulates swings across calls, so every execution
+    analyzes with a fresh detector from ``trend_detector_factory``; this
+    also keeps concurrent executions from sharing detector state.
+    """
 
     def __init__(
         self,
         fetch_latest: FetchLatestOHLCV,
-        trend_detector: TrendDetector,
+        trend_detector_factory: Callable[[], TrendDetector] = TrendDetector,
     ) -> None:
         self.fetch_latest = fetch_latest
-        self.trend_detector = trend_detector
+        self.trend_detector_factory = trend_detector_factory
 
     def execute(
         self,
@@ -60,7 +66,7 @@ class GenerateTradingDecision:
             return []
 
         # Analyze trend
-        trend_result = self.trend_detector.analyze(candles_list)
+        trend_result = self.trend_detector_factory().analyze(candles_list)
 
         # Get last candle for current price and timestamp
         last_candle = candles_list[-1]
@@ -114,10 +120,10 @@ class GenerateTradingDecision:
         decisions: list[TradingDecision] = []
 
         if len(candles_list) >= 20:
-            recent_prices = [float(c.close) for c in candles_list[-10:]]
-            previous_prices = [float(c.close) for c in candles_list[-20:-10]]
-            recent_avg = sum(recent_prices) / len(recent_prices)
-            previous_avg = sum(previous_prices) / len(previous_prices)
+            # One conversion pass over the 20 closes, split into the two windows
+            closes = [float(c.close) for c in candles_list[-20:]]
+            previous_avg = sum(closes[:10]) / 10
+            recent_avg = sum(closes[10:]) / 10
 
             # If recent price is above previous average, positive momentum
             if recent_avg > previous_avg * 1.001:  # 0.1% difference
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Sequence
+
+from domain.entities.candle import Candle
+
+
+@dataclass(frozen=True)
+class OhlcvArrays:
+    """
+    Column-oriented float view over a candle sequence.
+
+    Indicators compare prices as floats; converting the Decimal fields once
+    and sharing the columns avoids repeating the conversion for every
+    indicator that runs over the same candles. The original candles are kept
+    so results can still report exact Decimal prices and timestamps. The
+    indicators only compare highs, lows and closes, so ``open`` and
+    ``volume`` are converted on first access.
+    """
+
+    candles: Sequence[Candle]
+    high: tuple[float, ...]
+    low: tuple[float, ...]
+    close: tuple[float, ...]
+
+    def __len__(self) -> int:
+        return len(self.candles)
+
+    @cached_property
+    def open(self) -> tuple[float, ...]:
+        return tuple(float(c.open) for c in self.candles)
+
+    @cached_property
+    def volume(self) -> tuple[float, ...]:
+        return tuple(float(c.volume) for c in self.candles)
+
+    @classmethod
+    def from_candles(cls, candles: Sequence[Candle]) -> OhlcvArrays:
+        """Convert candles to float columns, keeping their order."""
+        return cls(
+            candles=candles,
+            high=tuple(float(c.high) for c in candles),
+            low=tuple(float(c.low) for c in candles),
+            close=tuple(float(c.close) for c in candles),
+        )
@@ -7,10 +7,11 @@ and trend signals.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from typing import Sequence
 
 
 class SwingClassification(str, Enum):
@@ -24,6 +25,14 @@ class SwingClassification(str, Enum):
     SWING_LOW = "SL"  # Unclassified swing low
 
 
+_HIGH_CLASSIFICATIONS = frozenset(
+    {SwingClassification.HIGHER_HIGH, SwingClassification.LOWER_HIGH, SwingClassification.SWING_HIGH}
+)
+_LOW_CLASSIFICATIONS = frozenset(
+    {SwingClassification.HIGHER_LOW, SwingClassification.LOWER_LOW, SwingClassification.SWING_LOW}
+)
+
+
 class BOSType(str, Enum):
     """Type of Break of Structure."""
 
@@ -39,7 +48,7 @@ class TrendDirection(str, Enum):
     UNDEFINED = "UNDEFINED"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SwingPoint:
     """
     Represents a swing point in the market structure.
@@ -56,23 +65,15 @@ class SwingPoint:
     @property
     def is_high(self) -> bool:
         """Check if this is a swing high."""
-        return self.classification in (
-            SwingClassification.HIGHER_HIGH,
-            SwingClassification.LOWER_HIGH,
-            SwingClassification.SWING_HIGH,
-        )
+        return self.classification in _HIGH_CLASSIFICATIONS
 
     @property
     def is_low(self) -> bool:
         """Check if this is a swing low."""
-        return self.classification in (
-            SwingClassification.HIGHER_LOW,
-            SwingClassification.LOWER_LOW,
-            SwingClassification.SWING_LOW,
-        )
+        return self.classification in _LOW_CLASSIFICATIONS
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BreakOfStructure:
     """
     Represents a Break of Structure (BOS) event.
@@ -90,15 +91,15 @@ class BreakOfStructure:
     @property
     def is_bullish(self) -> bool:
         """Check if this is a bullish BOS."""
-        return self.type == BOSType.BULLISH
+        return self.type is BOSType.BULLISH
 
     @property
     def is_bearish(self) -> bool:
         """Check if this is a bearish BOS."""
-        return self.type == BOSType.BEARISH
+        return self.type is BOSType.BEARISH
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrendSignal:
     """
     Result of trend analysis containing market structure information.
@@ -108,7 +109,7 @@ class TrendSignal:
     """
 
     trend: TrendDirection
-    swings: list[SwingPoint] = field(default_factory=list)
+    swings: Sequence[SwingPoint] = ()
     last_bos: BreakOfStructure | None = None
     confidence: float = 0.0
     reason: str = ""
@@ -116,15 +117,15 @@ class TrendSignal:
     @property
     def is_bullish(self) -> bool:
         """Check if the trend is bullish (up)."""
-        return self.trend == TrendDirection.UP
+        return self.trend is TrendDirection.UP
 
     @property
     def is_bearish(self) -> bool:
         """Check if the trend is bearish (down)."""
-        return self.trend == TrendDirection.DOWN
+        return self.trend is TrendDirection.DOWN
 
     @property
     def is_undefined(self) -> bool:
         """Check if the trend is undefined."""
-        return self.trend == TrendDirection.UNDEFINED
+        return self.trend is TrendDirection.UNDEFINED
 
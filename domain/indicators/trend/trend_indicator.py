@@ -7,12 +7,14 @@ to determine market trend direction based on SMC/ICT concepts.
 
 from __future__ import annotations
 
+import operator
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Sequence
+from typing import Iterator, Sequence
 
 from domain.entities.candle import Candle
+from domain.entities.ohlcv_arrays import OhlcvArrays
 from domain.indicators.base import Indicator
 from domain.indicators.trend.models import (
     BOSType,
@@ -23,6 +25,136 @@ from domain.indicators.trend.models import (
     TrendSignal,
 )
 
+# Swing classification indexed by [is_high][price > previous same-side swing]
+_CLASSIFICATION_TABLE = (
+    (SwingClassification.LOWER_LOW, SwingClassification.HIGHER_LOW),
+    (SwingClassification.LOWER_HIGH, SwingClassification.HIGHER_HIGH),
+)
+# Classification of the first swing on each side, indexed by is_high
+_FIRST_CLASSIFICATION = (SwingClassification.SWING_LOW, SwingClassification.SWING_HIGH)
+# Whether a new pivot at the same index beats the last swing, indexed by is_high
+_EXTENDS_SWING = (operator.le, operator.ge)
+
+_BULLISH_CLASSIFICATIONS = frozenset(
+    {SwingClassification.HIGHER_HIGH, SwingClassification.HIGHER_LOW}
+)
+_BEARISH_CLASSIFICATIONS = frozenset(
+    {SwingClassification.LOWER_LOW, SwingClassification.LOWER_HIGH}
+)
+# Plain-string labels and trend descriptions used to compose the reason text
+_CLASSIFICATION_LABELS = {c: c.value for c in SwingClassification}
+_TREND_REASONS = {
+    TrendDirection.UP: "Tendência de ALTA: Higher Highs e Higher Lows detectados",
+    TrendDirection.DOWN: "Tendência de BAIXA: Lower Lows e Lower Highs detectados",
+    TrendDirection.UNDEFINED: "Tendência INDEFINIDA: Estrutura não clara",
+}
+
+# Shared result for histories too short to confirm a swing; immutable, so safe to reuse
+_INSUFFICIENT_DATA_SIGNAL = TrendSignal(
+    trend=TrendDirection.UNDEFINED,
+    swings=(),
+    confidence=0.0,
+    reason="Dados insuficientes para análise",
+)
+
+
+@dataclass(frozen=True)
+class _TailSummary:
+    """Trend outputs derived together from the newest swings."""
+
+    trend: TrendDirection
+    confidence: float
+    reason: str
+
+
+class _SwingBuffer:
+    """
+    Fixed-capacity ring buffer holding the most recent swing points.
+
+    Appending overwrites the oldest slot once full, and tail(n) copies only
+    the last n entries instead of materializing the whole memory. The swing
+    types are also packed into an integer mask (bit 0 = newest swing, set
+    for highs) so recent highs and lows can be located without a scan.
+    """
+
+    __slots__ = ("_items", "_capacity", "_head", "_count", "_high_mask", "_mask_width")
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._items: list[SwingPoint | None] = [None] * capacity
+        self._head = 0  # Next slot to write
+        self._count = 0
+        self._high_mask = 0
+        self._mask_width = (1 << capacity) - 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[SwingPoint]:
+        return iter(self.tail(self._count))
+
+    def __reversed__(self) -> Iterator[SwingPoint]:
+        # Walk back from the newest slot without copying the buffer
+        items, capacity, head = self._items, self._capacity, self._head
+        for offset in range(1, self._count + 1):
+            yield items[(head - offset) % capacity]
+
+    def append(self, swing: SwingPoint) -> SwingPoint | None:
+        """Store a swing and return the one evicted to make room, if any."""
+        if not self._capacity:
+            return swing
+
+        evicted = self._items[self._head] if self._count == self._capacity else None
+        self._items[self._head] = swing
+        self._high_mask = ((self._high_mask << 1) | swing.is_high) & self._mask_width
+        self._head = (self._head + 1) % self._capacity
+        if self._count < self._capacity:
+            self._count += 1
+        return evicted
+
+    def last(self) -> SwingPoint | None:
+        """Return the most recent swing."""
+        return self._items[self._head - 1] if self._count else None
+
+    def replace_last(self, swing: SwingPoint) -> None:
+        """Overwrite the most recent swing in place with one of the same type."""
+        self._items[self._head - 1] = swing
+
+    def from_end(self, offset: int) -> SwingPoint:
+        """Return the swing offset positions back from the newest (0 = newest)."""
+        return self._items[(self._head - 1 - offset) % self._capacity]
+
+    def high_mask(self, n: int) -> int:
+        """Bitmask of highs among the last n swings, bit 0 being the newest."""
+        return self._high_mask & ((1 << min(n, self._count)) - 1)
+
+    def low_mask(self, n: int) -> int:
+        """Bitmask of lows among the last n swings, bit 0 being the newest."""
+        return ~self._high_mask & ((1 << min(n, self._count)) - 1)
+
+    def newest(self, mask: int) -> SwingPoint | None:
+        """Return the newest swing selected by a high/low mask, if any."""
+        return self.from_end(_lowest_bit(mask)) if mask else None
+
+    def tail(self, n: int) -> list[SwingPoint]:
+        """Return the last n swings, oldest first."""
+        n = min(n, self._count)
+        start = self._head - n
+        if start >= 0:
+            return self._items[start:self._head]
+        return self._items[start:] + self._items[:self._head]
+
+    def clear(self) -> None:
+        self._items = [None] * self._capacity
+        self._head = 0
+        self._count = 0
+        self._high_mask = 0
+
+
+def _lowest_bit(mask: int) -> int:
+    """Position of the lowest set bit of a non-zero mask."""
+    return (mask & -mask).bit_length() - 1
+
 
 @dataclass
 class TrendIndicatorSettings:
@@ -31,6 +163,12 @@ class TrendIndicatorSettings:
     max_swings: int = 20
     min_percent_move: Decimal = Decimal("0.003")  # 0.3% minimum move
     lookback_bars: int = 3  # Bars to confirm swing
+    use_float_fastpath: bool = True  # Compare prices as float64 instead of Decimal
+    build_reason: bool = True  # Compose the human-readable reason text
+    _min_percent_move_f: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._min_percent_move_f = float(self.min_percent_move)
 
     def is_significant_move(self, from_price: Decimal, to_price: Decimal) -> bool:
         """Check if the price move is significant enough."""
@@ -39,6 +177,12 @@ class TrendIndicatorSettings:
         percent_move = abs(to_price - from_price) / from_price
         return percent_move >= self.min_percent_move
 
+    def is_significant_move_f(self, from_price: float, to_price: float) -> bool:
+        """Float64 variant of is_significant_move."""
+        if from_price == 0:
+            return True
+        return abs(to_price - from_price) / from_price >= self._min_percent_move_f
+
 
 class TrendIndicator(Indicator[TrendSignal]):
     """
@@ -54,9 +198,28 @@ class TrendIndicator(Indicator[TrendSignal]):
 
     def __init__(self, settings: TrendIndicatorSettings | None = None) -> None:
         self._settings = settings or TrendIndicatorSettings()
-        self._swings: deque[SwingPoint] = deque(maxlen=self._settings.max_swings)
+        # Derived from settings once so the per-bar path reads plain attributes
+        self._lookback = self._settings.lookback_bars
+        self._window_size = self._lookback * 2 + 1
+        self._to_number = float if self._settings.use_float_fastpath else Decimal
+        self._is_significant = (
+            self._settings.is_significant_move_f
+            if self._settings.use_float_fastpath
+            else self._settings.is_significant_move
+        )
+        self._swings = _SwingBuffer(self._settings.max_swings)
         self._last_bos: BreakOfStructure | None = None
         self._current_trend: TrendDirection = TrendDirection.UNDEFINED
+        # Most recent swing high/low kept in memory, maintained on register
+        self._last_high: SwingPoint | None = None
+        self._last_low: SwingPoint | None = None
+        # Streaming state: confirmation window and last classified prices
+        self._tail: deque[tuple[Candle, float | Decimal, float | Decimal]] = deque(
+            maxlen=self._window_size
+        )
+        self._bar_count = 0
+        # Last classified [low, high] price, indexed by is_high
+        self._last_swing_prices: list[float | Decimal | None] = [None, None]
 
     @property
     def name(self) -> str:
@@ -65,7 +228,7 @@ class TrendIndicator(Indicator[TrendSignal]):
     @property
     def swings(self) -> list[SwingPoint]:
         """Get the current list of swing points."""
-        return list(self._swings)
+        return self._swings.tail(len(self._swings))
 
     @property
     def last_bos(self) -> BreakOfStructure | None:
@@ -77,159 +240,218 @@ class TrendIndicator(Indicator[TrendSignal]):
         self._swings.clear()
         self._last_bos = None
         self._current_trend = TrendDirection.UNDEFINED
+        self._last_high = None
+        self._last_low = None
+        self._tail.clear()
+        self._bar_count = 0
+        self._last_swing_prices = [None, None]
 
-    def analyze(self, candles: Sequence[Candle]) -> TrendSignal:
+    def analyze(self, candles: Sequence[Candle] | OhlcvArrays) -> TrendSignal:
         """
         Analyze candles to detect market structure and trend.
 
+        The indicator is reset first, so the result depends only on the
+        given history. Use update() to feed a live stream bar by bar.
+
         Args:
-            candles: Sequence of OHLCV candles to analyze.
+            candles: Sequence of OHLCV candles to analyze, or their
+                pre-converted float columns.
 
         Returns:
             TrendSignal with detected trend, swings, and BOS.
         """
-        if len(candles) < self._settings.lookback_bars * 2 + 1:
-            return TrendSignal(
-                trend=TrendDirection.UNDEFINED,
-                swings=[],
-                confidence=0.0,
-                reason="Dados insuficientes para análise",
-            )
+        self.reset()
 
-        # Step 1: Detect raw swing points
-        raw_swings = self._detect_swing_points(candles)
+        if len(candles) < self._window_size:
+            return _INSUFFICIENT_DATA_SIGNAL
 
-        # Step 2: Classify swings as HH, HL, LL, LH
-        classified_swings = self._classify_swings(raw_swings, candles)
+        arrays = candles if isinstance(candles, OhlcvArrays) else None
+        if arrays is not None:
+            candles = arrays.candles
 
-        # Step 3: Update internal swing memory
-        for swing in classified_swings:
-            self._register_swing(swing)
+        highs, lows, closes = self._price_columns(candles, arrays)
 
-        # Step 4: Detect BOS
-        self._detect_bos(candles)
+        # Steps 1-3: Detect, classify and register swings
+        self._scan_history(candles, highs, lows)
+
+        # Step 4: Detect BOS on the latest close
+        self._detect_bos(candles[-1], closes[-1], len(candles) - 1)
 
         # Step 5: Determine trend
-        trend = self._determine_trend()
-        confidence = self._calculate_confidence()
-        reason = self._build_reason(trend)
+        return self._build_signal()
+
+    def update(self, candle: Candle) -> TrendSignal:
+        """
+        Feed a single new candle and return the updated signal.
+
+        Only the bar that just became confirmable (lookback bars ago) is
+        tested for a swing, and BOS is checked against the new close, so
+        each call costs O(lookback) instead of a full re-analysis.
+        """
+        to_number = self._to_number
+        high, low, close = to_number(candle.high), to_number(candle.low), to_number(candle.close)
+
+        self._push(candle, high, low)
+
+        if self._bar_count < self._window_size:
+            return _INSUFFICIENT_DATA_SIGNAL
+
+        # BOS only describes the latest close, as in analyze(); drop the previous bar's break
+        self._last_bos = None
+        self._current_trend = TrendDirection.UNDEFINED
+        self._detect_bos(candle, close, self._bar_count - 1)
+        return self._build_signal()
+
+    def _build_signal(self) -> TrendSignal:
+        summary = self._summarize_tail()
 
         return TrendSignal(
-            trend=trend,
+            trend=summary.trend,
             swings=self.swings,
             last_bos=self._last_bos,
-            confidence=confidence,
-            reason=reason,
+            confidence=summary.confidence,
+            reason=summary.reason,
         )
 
-    def _detect_swing_points(self, candles: Sequence[Candle]) -> list[tuple[int, Decimal, bool]]:
+    def _price_columns(
+        self, candles: Sequence[Candle], arrays: OhlcvArrays | None = None
+    ) -> tuple[Sequence[float | Decimal], Sequence[float | Decimal], Sequence[float | Decimal]]:
         """
-        Detect swing highs and lows using lookback confirmation.
+        Extract high/low/close columns used for structure comparisons.
 
-        Returns list of tuples: (index, price, is_high)
+        With the float fast path enabled the prices come from shared float64
+        columns, so the scans below avoid allocating a Decimal per operation.
+        Output objects always keep the original Decimal prices.
         """
-        swings: list[tuple[int, Decimal, bool]] = []
-        lookback = self._settings.lookback_bars
+        if self._settings.use_float_fastpath:
+            arrays = arrays or OhlcvArrays.from_candles(candles)
+            return arrays.high, arrays.low, arrays.close
+        return (
+            [c.high for c in candles],
+            [c.low for c in candles],
+            [c.close for c in candles],
+        )
 
-        for i in range(lookback, len(candles) - lookback):
-            candle = candles[i]
+    def _scan_history(
+        self,
+        candles: Sequence[Candle],
+        highs: Sequence[float | Decimal],
+        lows: Sequence[float | Decimal],
+    ) -> None:
+        """
+        Detect swings over a whole history in one batch.
 
-            # Check for swing high
-            is_swing_high = all(
-                candle.high >= candles[i - j].high and candle.high >= candles[i + j].high
-                for j in range(1, lookback + 1)
-            )
+        Equivalent to pushing every bar, but each pivot is compared against
+        the max/min of its window slice, which runs in C instead of a Python
+        generator per bar. The confirmation window is left primed with the
+        last bars so update() can continue the stream.
+        """
+        lookback = self._lookback
+        window = self._window_size
+        count = len(candles)
+
+        for index in range(lookback, count - lookback):
+            start = index - lookback
+            end = start + window
+            pivot_high = highs[index]
+            pivot_low = lows[index]
+            is_swing_high = pivot_high >= max(highs[start:end])
+            is_swing_low = pivot_low <= min(lows[start:end])
+
+            if is_swing_high or is_swing_low:
+                candle = candles[index]
+                if is_swing_high:
+                    self._register_swing(self._classify_swing(candle, index, pivot_high, is_high=True))
+                if is_swing_low:
+                    self._register_swing(self._classify_swing(candle, index, pivot_low, is_high=False))
+
+        tail_start = count - window
+        self._tail.extend(zip(candles[tail_start:], highs[tail_start:], lows[tail_start:]))
+        self._bar_count = count
+
+    def _push(self, candle: Candle, high: float | Decimal, low: float | Decimal) -> None:
+        """
+        Append a bar to the confirmation window and test its middle bar.
 
-            # Check for swing low
-            is_swing_low = all(
-                candle.low <= candles[i - j].low and candle.low <= candles[i + j].low
-                for j in range(1, lookback + 1)
-            )
+        The middle bar is a swing high (low) when its high (low) is at least
+        as extreme as every other bar within lookback on both sides.
+        """
+        self._tail.append((candle, high, low))
+        self._bar_count += 1
+
+        if len(self._tail) < self._window_size:
+            return
 
-            if is_swing_high:
-                swings.append((i, candle.high, True))
+        lookback = self._lookback
+        pivot, pivot_high, pivot_low = self._tail[lookback]
+        index = self._bar_count - 1 - lookback
 
-            if is_swing_low:
-                swings.append((i, candle.low, False))
+        if all(pivot_high >= high for _, high, _ in self._tail):
+            self._register_swing(self._classify_swing(pivot, index, pivot_high, is_high=True))
 
-        return swings
+        if all(pivot_low <= low for _, _, low in self._tail):
+            self._register_swing(self._classify_swing(pivot, index, pivot_low, is_high=False))
 
-    def _classify_swings(
-        self, raw_swings: list[tuple[int, Decimal, bool]], candles: Sequence[Candle]
-    ) -> list[SwingPoint]:
+    def _classify_swing(
+        self, candle: Candle, index: int, price: float | Decimal, is_high: bool
+    ) -> SwingPoint:
         """
-        Classify swing points as HH, HL, LL, LH based on previous swings.
+        Classify a swing point as HH, HL, LL, LH based on the previous swing.
+
+        Uses table lookups indexed by the swing side and the price comparison
+        instead of an if/elif chain per side.
         """
-        if not raw_swings:
-            return []
-
-        classified: list[SwingPoint] = []
-        last_high: SwingPoint | None = None
-        last_low: SwingPoint | None = None
-
-        # Get last known highs and lows from memory
-        for swing in self._swings:
-            if swing.is_high:
-                last_high = swing
-            else:
-                last_low = swing
-
-        for idx, price, is_high in raw_swings:
-            timestamp = candles[idx].timestamp
-
-            if is_high:
-                # Classify swing high
-                if last_high is None:
-                    classification = SwingClassification.SWING_HIGH
-                elif price > last_high.price:
-                    classification = SwingClassification.HIGHER_HIGH
-                else:
-                    classification = SwingClassification.LOWER_HIGH
-
-                swing = SwingPoint(
-                    price=price,
-                    timestamp=timestamp,
-                    index=idx,
-                    classification=classification,
-                )
-                classified.append(swing)
-                last_high = swing
-            else:
-                # Classify swing low
-                if last_low is None:
-                    classification = SwingClassification.SWING_LOW
-                elif price > last_low.price:
-                    classification = SwingClassification.HIGHER_LOW
-                else:
-                    classification = SwingClassification.LOWER_LOW
-
-                swing = SwingPoint(
-                    price=price,
-                    timestamp=timestamp,
-                    index=idx,
-                    classification=classification,
-                )
-                classified.append(swing)
-                last_low = swing
+        previous = self._last_swing_prices[is_high]
+        self._last_swing_prices[is_high] = price
+
+        if previous is None:
+            classification = _FIRST_CLASSIFICATION[is_high]
+        else:
+            classification = _CLASSIFICATION_TABLE[is_high][price > previous]
 
-        return classified
+        return SwingPoint(
+            price=candle.high if is_high else candle.low,
+            timestamp=candle.timestamp,
+            index=index,
+            classification=classification,
+        )
 
     def _register_swing(self, swing: SwingPoint) -> None:
         """Register a new swing point in memory."""
         # Check for duplicate at same index
-        if self._swings and self._swings[-1].index == swing.index:
+        last = self._swings.last()
+        if last is not None and last.index == swing.index:
             # Replace if same type and better price
-            last = self._swings[-1]
-            if last.is_high == swing.is_high:
-                if (swing.is_high and swing.price >= last.price) or \
-                   (swing.is_low and swing.price <= last.price):
-                    self._swings.pop()
-                    self._swings.append(swing)
+            is_high = swing.is_high
+            if last.is_high is is_high:
+                if _EXTENDS_SWING[is_high](swing.price, last.price):
+                    self._swings.replace_last(swing)
+                    self._remember_extreme(swing)
                 return
 
-        self._swings.append(swing)
+        evicted = self._swings.append(swing)
+        self._remember_extreme(swing)
+
+        # The cached extreme of the other side may have just left the window
+        if evicted is not None and (evicted is self._last_high or evicted is self._last_low):
+            self._rebuild_extremes()
+
+    def _remember_extreme(self, swing: SwingPoint) -> None:
+        """Track the swing as the most recent high or low."""
+        if swing.is_high:
+            self._last_high = swing
+        else:
+            self._last_low = swing
+
+    def _rebuild_extremes(self) -> None:
+        """Recompute the cached last high/low from the swing-type bitmask."""
+        count = len(self._swings)
+        self._last_high = self._swings.newest(self._swings.high_mask(count))
+        self._last_low = self._swings.newest(self._swings.low_mask(count))
 
-    def _detect_bos(self, candles: Sequence[Candle]) -> None:
+    def _detect_bos(
+        self, current_candle: Candle, current_close: float | Decimal, index: int
+    ) -> None:
         """
         Detect Break of Structure.
 
@@ -239,78 +461,112 @@ class TrendIndicator(Indicator[TrendSignal]):
         if len(self._swings) < 2:
             return
 
-        # Find the last swing high and low
-        last_swing_high: SwingPoint | None = None
-        last_swing_low: SwingPoint | None = None
-
-        for swing in reversed(list(self._swings)):
-            if swing.is_high and last_swing_high is None:
-                last_swing_high = swing
-            elif swing.is_low and last_swing_low is None:
-                last_swing_low = swing
-
-            if last_swing_high and last_swing_low:
-                break
-
-        if not candles:
-            return
+        last_swing_high = self._last_high
+        last_swing_low = self._last_low
 
-        current_candle = candles[-1]
+        to_number = self._to_number
+        high_price = to_number(last_swing_high.price) if last_swing_high else None
+        low_price = to_number(last_swing_low.price) if last_swing_low else None
 
         # Check for bullish BOS (price breaks above swing high)
-        if last_swing_high and current_candle.close > last_swing_high.price:
-            if self._settings.is_significant_move(last_swing_high.price, current_candle.close):
+        if high_price is not None and current_close > high_price:
+            if self._is_significant(high_price, current_close):
                 self._last_bos = BreakOfStructure(
                     type=BOSType.BULLISH,
                     broken_swing=last_swing_high,
                     break_price=current_candle.close,
                     break_timestamp=current_candle.timestamp,
-                    break_index=len(candles) - 1,
+                    break_index=index,
                 )
                 self._current_trend = TrendDirection.UP
 
         # Check for bearish BOS (price breaks below swing low)
-        elif last_swing_low and current_candle.close < last_swing_low.price:
-            if self._settings.is_significant_move(last_swing_low.price, current_candle.close):
+        elif low_price is not None and current_close < low_price:
+            if self._is_significant(low_price, current_close):
                 self._last_bos = BreakOfStructure(
                     type=BOSType.BEARISH,
                     broken_swing=last_swing_low,
                     break_price=current_candle.close,
                     break_timestamp=current_candle.timestamp,
-                    break_index=len(candles) - 1,
+                    break_index=index,
                 )
                 self._current_trend = TrendDirection.DOWN
 
-    def _determine_trend(self) -> TrendDirection:
+    def _summarize_tail(self) -> _TailSummary:
         """
-        Determine the current trend based on swing structure.
+        Derive trend, confidence and reason from the newest swings in one pass.
 
         UP trend: HH + HL sequence
         DOWN trend: LL + LH sequence
         """
-        if len(self._swings) < 4:
-            return self._current_trend if self._current_trend != TrendDirection.UNDEFINED else TrendDirection.UNDEFINED
+        count = len(self._swings)
+        build_reason = self._settings.build_reason
+        if not count:
+            return _TailSummary(
+                self._current_trend, 0.0, "Nenhum swing detectado ainda." if build_reason else ""
+            )
+
+        # Base confidence, more swings = higher confidence, BOS confirmation adds confidence
+        base_confidence = 0.3
+        swing_factor = min(count / self._settings.max_swings, 1.0) * 0.3
+        bos_factor = 0.2 if self._last_bos else 0.0
+
+        if count < 4:
+            return _TailSummary(
+                trend=self._current_trend,
+                confidence=min(base_confidence + swing_factor + bos_factor, 1.0),
+                reason=f"Apenas {count} swings detectados. Aguardando mais dados." if build_reason else "",
+            )
 
-        # Get recent swing classifications
-        recent_swings = list(self._swings)[-6:]
+        # Single walk over the last four swings for structure and description
+        labels = []
+        bullish_count = bearish_count = 0
+        for swing in self._swings.tail(4):
+            classification = swing.classification
+            labels.append(_CLASSIFICATION_LABELS[classification])
+            if classification in _BULLISH_CLASSIFICATIONS:
+                bullish_count += 1
+            elif classification in _BEARISH_CLASSIFICATIONS:
+                bearish_count += 1
 
-        highs = [s for s in recent_swings if s.is_high]
-        lows = [s for s in recent_swings if s.is_low]
+        # Consistent structure adds confidence
+        structure_factor = 0.2 if bullish_count >= 3 or bearish_count >= 3 else 0.0
+        confidence = min(base_confidence + swing_factor + bos_factor + structure_factor, 1.0)
+
+        trend = self._structure_trend()
+
+        if not build_reason:
+            return _TailSummary(trend, confidence, "")
+
+        bos = self._last_bos
+        bos_part = (
+            f"BOS de {'alta' if bos.is_bullish else 'baixa'} confirmado em {bos.break_price}. "
+            if bos
+            else ""
+        )
+        reason = f"Estrutura recente: {' → '.join(labels)}. {bos_part}{_TREND_REASONS[trend]}."
+        return _TailSummary(trend, confidence, reason)
 
-        if len(highs) >= 2 and len(lows) >= 2:
-            last_two_highs = highs[-2:]
-            last_two_lows = lows[-2:]
+    def _structure_trend(self) -> TrendDirection:
+        """Trend from the newest high/low among the last six swings, else the last BOS."""
+        # Locate the newest high and low among the recent swings
+        highs = self._swings.high_mask(6)
+        lows = self._swings.low_mask(6)
+
+        if highs.bit_count() >= 2 and lows.bit_count() >= 2:
+            last_high = self._swings.newest(highs)
+            last_low = self._swings.newest(lows)
 
             # Check for bullish structure: HH + HL
-            has_hh = last_two_highs[-1].classification == SwingClassification.HIGHER_HIGH
-            has_hl = last_two_lows[-1].classification == SwingClassification.HIGHER_LOW
+            has_hh = last_high.classification is SwingClassification.HIGHER_HIGH
+            has_hl = last_low.classification is SwingClassification.HIGHER_LOW
 
             if has_hh and has_hl:
                 return TrendDirection.UP
 
             # Check for bearish structure: LL + LH
-            has_ll = last_two_lows[-1].classification == SwingClassification.LOWER_LOW
-            has_lh = last_two_highs[-1].classification == SwingClassification.LOWER_HIGH
+            has_ll = last_low.classification is SwingClassification.LOWER_LOW
+            has_lh = last_high.classification is SwingClassification.LOWER_HIGH
 
             if has_ll and has_lh:
                 return TrendDirection.DOWN
@@ -320,68 +576,3 @@ class TrendIndicator(Indicator[TrendSignal]):
             return TrendDirection.UP if self._last_bos.is_bullish else TrendDirection.DOWN
 
         return self._current_trend
-
-    def _calculate_confidence(self) -> float:
-        """Calculate confidence level based on available data."""
-        if not self._swings:
-            return 0.0
-
-        base_confidence = 0.3
-
-        # More swings = higher confidence
-        swing_factor = min(len(self._swings) / self._settings.max_swings, 1.0) * 0.3
-
-        # BOS confirmation adds confidence
-        bos_factor = 0.2 if self._last_bos else 0.0
-
-        # Consistent structure adds confidence
-        structure_factor = 0.0
-        if len(self._swings) >= 4:
-            recent = list(self._swings)[-4:]
-            classifications = [s.classification for s in recent]
-
-            # Check for consistent bullish or bearish structure
-            bullish_count = sum(
-                1 for c in classifications
-                if c in (SwingClassification.HIGHER_HIGH, SwingClassification.HIGHER_LOW)
-            )
-            bearish_count = sum(
-                1 for c in classifications
-                if c in (SwingClassification.LOWER_LOW, SwingClassification.LOWER_HIGH)
-            )
-
-            if bullish_count >= 3 or bearish_count >= 3:
-                structure_factor = 0.2
-
-        return min(base_confidence + swing_factor + bos_factor + structure_factor, 1.0)
-
-    def _build_reason(self, trend: TrendDirection) -> str:
-        """Build a human-readable reason for the trend determination."""
-        if not self._swings:
-            return "Nenhum swing detectado ainda."
-
-        if len(self._swings) < 4:
-            return f"Apenas {len(self._swings)} swings detectados. Aguardando mais dados."
-
-        reasons = []
-
-        # Describe recent structure
-        recent = list(self._swings)[-4:]
-        structure_desc = " → ".join([s.classification.value for s in recent])
-        reasons.append(f"Estrutura recente: {structure_desc}")
-
-        # Describe BOS if present
-        if self._last_bos:
-            bos_type = "alta" if self._last_bos.is_bullish else "baixa"
-            reasons.append(f"BOS de {bos_type} confirmado em {self._last_bos.break_price}")
-
-        # Describe trend
-        if trend == TrendDirection.UP:
-            reasons.append("Tendência de ALTA: Higher Highs e Higher Lows detectados")
-        elif trend == TrendDirection.DOWN:
-            reasons.append("Tendência de BAIXA: Lower Lows e Lower Highs detectados")
-        else:
-            reasons.append("Tendência INDEFINIDA: Estrutura não clara")
-
-        return ". ".join(reasons) + "."
-
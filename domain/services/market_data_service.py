@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Sequence
+from typing import Iterable, Sequence
 
 from domain.entities.candle import Candle
+from domain.entities.ohlcv_arrays import OhlcvArrays
 from domain.value_objects.timeframe import Timeframe
 
 
@@ -27,3 +28,42 @@ class MarketDataService(ABC):
         limit: int | None = None,
     ) -> Sequence[Candle]:
         """Fetch historical OHLCV candles for a symbol within a window."""
+
+    def get_many_latest_ohlcv(
+        self, symbols: Iterable[str], timeframe: Timeframe, count: int = 1
+    ) -> dict[str, Sequence[Candle]]:
+        """
+        Fetch the latest OHLCV candles for several symbols, keyed by symbol.
+
+        Providers that accept several symbols per request override this to
+        make one call; symbols they fail to deliver are left out.
+        """
+        return {
+            symbol: self.get_latest_ohlcv(symbol=symbol, timeframe=timeframe, count=count)
+            for symbol in dict.fromkeys(symbols)
+        }
+
+    def get_many_historical_ohlcv(
+        self,
+        symbols: Iterable[str],
+        timeframe: Timeframe,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int | None = None,
+    ) -> dict[str, Sequence[Candle]]:
+        """Fetch the same historical window for several symbols, keyed by symbol."""
+        return {
+            symbol: self.get_historical_ohlcv(
+                symbol=symbol, timeframe=timeframe, start=start, end=end, limit=limit
+            )
+            for symbol in dict.fromkeys(symbols)
+        }
+
+    def get_ohlcv_arrays(
+        self, symbol: str, timeframe: Timeframe, count: int = 1
+    ) -> OhlcvArrays:
+        """Fetch the latest candles as float columns, oldest first."""
+        candles = list(self.get_latest_ohlcv(symbol=symbol, timeframe=timeframe, count=count))
+        if candles and candles[0].timestamp > candles[-1].timestamp:
+            candles.reverse()
+        return OhlcvArrays.from_candles(candles)
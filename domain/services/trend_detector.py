@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import operator
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Iterable, Sequence
 
 from domain.entities.candle import Candle
+from domain.entities.ohlcv_arrays import OhlcvArrays
 from domain.value_objects.trend import Swing, SwingType, TrendDirection, TrendResult
 
+# Whether a new pivot extends the previous swing of the same type
+_EXTENDS_SWING = {SwingType.HIGH: operator.ge, SwingType.LOW: operator.le}
+
 
 @dataclass
 class SwingSettings:
@@ -16,6 +21,18 @@ class SwingSettings:
     max_swings: int = 12
     min_price_move: Decimal | None = None
     min_percent_move: Decimal = Decimal("0.005")
+    use_float_fastpath: bool = True
+    # Float copies of the thresholds for the float64 scan
+    _min_price_move_f: float | None = field(init=False, repr=False, compare=False)
+    _min_percent_move_f: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.max_swings < 1:
+            raise ValueError("max_swings must be greater than zero.")
+        self._min_price_move_f = (
+            float(self.min_price_move) if self.min_price_move is not None else None
+        )
+        self._min_percent_move_f = float(self.min_percent_move)
 
     def is_significant(self, last_price: Decimal | None, candidate_price: Decimal) -> bool:
         """Check if the move between swings meets the configured thresholds."""
@@ -34,6 +51,22 @@ class SwingSettings:
         percent_move = price_change / last_price
         return percent_move >= self.min_percent_move
 
+    def is_significant_f(self, last_price: float | None, candidate_price: float) -> bool:
+        """Float64 variant of is_significant using the thresholds converted at construction."""
+
+        if last_price is None:
+            return True
+
+        price_change = abs(candidate_price - last_price)
+
+        if self._min_price_move_f is not None and price_change < self._min_price_move_f:
+            return False
+
+        if last_price == 0:
+            return True
+
+        return price_change / last_price >= self._min_percent_move_f
+
 
 class TrendDetector:
     """
@@ -47,7 +80,16 @@ class TrendDetector:
 
     def __init__(self, settings: SwingSettings | None = None) -> None:
         self.settings = settings or SwingSettings()
+        # Significance predicate matching the numeric type of the scan
+        self._is_significant = (
+            self.settings.is_significant_f
+            if self.settings.use_float_fastpath
+            else self.settings.is_significant
+        )
         self._swings: deque[Swing] = deque(maxlen=self.settings.max_swings)
+        # Last two highs/lows still inside the swing memory, oldest first
+        self._last_two_highs: deque[Swing] = deque(maxlen=2)
+        self._last_two_lows: deque[Swing] = deque(maxlen=2)
 
     @property
     def swings(self) -> list[Swing]:
@@ -55,12 +97,16 @@ class TrendDetector:
 
         return list(self._swings)
 
-    def analyze(self, candles: Sequence[Candle]) -> TrendResult:
+    def analyze(self, candles: Sequence[Candle] | OhlcvArrays) -> TrendResult:
         """Process candles to update swing memory and classify the trend."""
 
+        arrays = candles if isinstance(candles, OhlcvArrays) else None
+        if arrays is not None:
+            candles = arrays.candles
+
         anchor_price = candles[0].close if candles else None
 
-        for swing in self._detect_swings(candles):
+        for swing in self._detect_swings(candles, arrays):
             self._register_swing(swing, anchor_price)
 
         trend = self._classify_trend()
@@ -74,96 +120,82 @@ class TrendDetector:
             reason=reason,
         )
 
-    def _detect_swings(self, candles: Sequence[Candle]) -> Iterable[Swing]:
+    def _detect_swings(
+        self, candles: Sequence[Candle], arrays: OhlcvArrays | None = None
+    ) -> Iterable[Swing]:
         if len(candles) < 2:
             return []
 
+        if self.settings.use_float_fastpath:
+            arrays = arrays or OhlcvArrays.from_candles(candles)
+            highs, lows, closes = arrays.high, arrays.low, arrays.close
+        else:
+            highs = [c.high for c in candles]
+            lows = [c.low for c in candles]
+            closes = [c.close for c in candles]
+        is_significant = self._is_significant
+
         swings: list[Swing] = []
-        anchor = candles[0]
         direction: SwingType | None = None
-        extreme_price = anchor.close
+        extreme_price = closes[0]
         extreme_idx = 0
 
         for idx in range(1, len(candles)):
-            candle = candles[idx]
-
             if direction is None:
-                if self.settings.is_significant(extreme_price, candle.close):
-                    if candle.close > extreme_price:
-                        swings.append(
-                            Swing(
-                                index=extreme_idx,
-                                price=anchor.low,
-                                timestamp=anchor.timestamp,
-                                type=SwingType.LOW,
-                            )
-                        )
+                close = closes[idx]
+                if is_significant(extreme_price, close):
+                    if close > extreme_price:
+                        swings.append(self._swing_at(candles, extreme_idx, SwingType.LOW))
                         direction = SwingType.HIGH
-                        extreme_price = candle.high
+                        extreme_price = highs[idx]
                         extreme_idx = idx
-                    elif candle.close < extreme_price:
-                        swings.append(
-                            Swing(
-                                index=extreme_idx,
-                                price=anchor.high,
-                                timestamp=anchor.timestamp,
-                                type=SwingType.HIGH,
-                            )
-                        )
+                    elif close < extreme_price:
+                        swings.append(self._swing_at(candles, extreme_idx, SwingType.HIGH))
                         direction = SwingType.LOW
-                        extreme_price = candle.low
+                        extreme_price = lows[idx]
                         extreme_idx = idx
                 continue
 
             if direction is SwingType.HIGH:
-                if candle.high >= extreme_price:
-                    extreme_price = candle.high
+                if highs[idx] >= extreme_price:
+                    extreme_price = highs[idx]
                     extreme_idx = idx
                     continue
 
-                if self.settings.is_significant(extreme_price, candle.low):
-                    swings.append(
-                        Swing(
-                            index=extreme_idx,
-                            price=extreme_price,
-                            timestamp=candles[extreme_idx].timestamp,
-                            type=SwingType.HIGH,
-                        )
-                    )
+                if is_significant(extreme_price, lows[idx]):
+                    swings.append(self._swing_at(candles, extreme_idx, SwingType.HIGH))
                     direction = SwingType.LOW
-                    extreme_price = candle.low
+                    extreme_price = lows[idx]
                     extreme_idx = idx
             else:
-                if candle.low <= extreme_price:
-                    extreme_price = candle.low
+                if lows[idx] <= extreme_price:
+                    extreme_price = lows[idx]
                     extreme_idx = idx
                     continue
 
-                if self.settings.is_significant(extreme_price, candle.high):
-                    swings.append(
-                        Swing(
-                            index=extreme_idx,
-                            price=extreme_price,
-                            timestamp=candles[extreme_idx].timestamp,
-                            type=SwingType.LOW,
-                        )
-                    )
+                if is_significant(extreme_price, highs[idx]):
+                    swings.append(self._swing_at(candles, extreme_idx, SwingType.LOW))
                     direction = SwingType.HIGH
-                    extreme_price = candle.high
+                    extreme_price = highs[idx]
                     extreme_idx = idx
 
         if direction is not None:
-            swings.append(
-                Swing(
-                    index=extreme_idx,
-                    price=extreme_price,
-                    timestamp=candles[extreme_idx].timestamp,
-                    type=direction,
-                )
-            )
+            swings.append(self._swing_at(candles, extreme_idx, direction))
 
         return swings
 
+    @staticmethod
+    def _swing_at(candles: Sequence[Candle], idx: int, swing_type: SwingType) -> Swing:
+        """Build a swing keeping the original Decimal price of the pivot candle."""
+
+        candle = candles[idx]
+        return Swing(
+            index=idx,
+            price=candle.high if swing_type is SwingType.HIGH else candle.low,
+            timestamp=candle.timestamp,
+            type=swing_type,
+        )
+
     def _register_swing(self, swing: Swing, anchor_price: Decimal | None) -> None:
         last_swing = self._swings[-1] if self._swings else None
         baseline_price = last_swing.price if last_swing else anchor_price
@@ -171,33 +203,34 @@ class TrendDetector:
         if not self.settings.is_significant(baseline_price, swing.price):
             return
 
-        if last_swing and last_swing.type == swing.type:
-            should_replace = False
-
-            if swing.type is SwingType.HIGH and swing.price >= last_swing.price:
-                should_replace = True
-            elif swing.type is SwingType.LOW and swing.price <= last_swing.price:
-                should_replace = True
-
-            if should_replace:
-                self._swings.pop()
-                self._swings.append(swing)
+        if last_swing and last_swing.type is swing.type:
+            # Same-side swing: keep whichever pivot is more extreme, in place
+            if _EXTENDS_SWING[swing.type](swing.price, last_swing.price):
+                self._swings[-1] = swing
+                self._same_type_swings(swing.type)[-1] = swing
             return
 
+        if len(self._swings) == self._swings.maxlen:
+            evicted = self._swings[0]
+            same_type = self._same_type_swings(evicted.type)
+            if same_type and same_type[0] is evicted:
+                same_type.popleft()
+
         self._swings.append(swing)
+        self._same_type_swings(swing.type).append(swing)
+
+    def _same_type_swings(self, swing_type: SwingType) -> deque[Swing]:
+        return self._last_two_highs if swing_type is SwingType.HIGH else self._last_two_lows
 
     def _classify_trend(self) -> TrendDirection:
-        highs = [s for s in self._swings if s.type is SwingType.HIGH]
-        lows = [s for s in self._swings if s.type is SwingType.LOW]
+        highs = self._last_two_highs
+        lows = self._last_two_lows
 
         if len(highs) >= 2 and len(lows) >= 2:
-            last_highs = highs[-2:]
-            last_lows = lows[-2:]
-
-            if last_highs[-1].price > last_highs[0].price and last_lows[-1].price > last_lows[0].price:
+            if highs[-1].price > highs[0].price and lows[-1].price > lows[0].price:
                 return TrendDirection.UP
 
-            if last_highs[-1].price < last_highs[0].price and last_lows[-1].price < last_lows[0].price:
+            if highs[-1].price < highs[0].price and lows[-1].price < lows[0].price:
                 return TrendDirection.DOWN
 
         if highs and lows:
@@ -228,7 +261,7 @@ class TrendDetector:
         return TrendDirection.undefined()
 
     def _compute_confidence(self, trend: TrendDirection) -> float:
-        if trend == TrendDirection.undefined():
+        if trend is TrendDirection.UNDEFINED:
             return 0.25 if self._swings else 0.0
 
         depth_factor = min(len(self._swings) / max(self.settings.max_swings, 1), 1)
@@ -28,7 +28,7 @@ class SwingType(str, Enum):
     LOW = "LOW"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Swing:
     """Represents a pivot swing extracted from price action."""
 
@@ -38,7 +38,7 @@ class Swing:
     type: SwingType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrendResult:
     """Standard output for the trend detector."""
 
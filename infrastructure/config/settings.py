@@ -29,6 +29,7 @@ class Settings:
     api_key: str | None
     base_url: str | None
     log_level: int
+    worker_threads: int = 64
 
 
 def load_settings() -> Settings:
@@ -41,5 +42,18 @@ def load_settings() -> Settings:
     api_key = os.getenv("TWELVEDATA_API_KEY")
     base_url = os.getenv("TWELVEDATA_BASE_URL")
     log_level = _parse_log_level(os.getenv("LOG_LEVEL"))
-
-    return Settings(env=env, api_key=api_key, base_url=base_url, log_level=log_level)
+    worker_threads_value = os.getenv("API_WORKER_THREADS", "64")
+    try:
+        worker_threads = int(worker_threads_value)
+    except ValueError as exc:
+        raise ValueError(f"Invalid API_WORKER_THREADS value: {worker_threads_value}.") from exc
+    if worker_threads < 1:
+        raise ValueError(f"Invalid API_WORKER_THREADS value: {worker_threads_value}.")
+
+    return Settings(
+        env=env,
+        api_key=api_key,
+        base_url=base_url,
+        log_level=log_level,
+        worker_threads=worker_threads,
+    )
@@ -1,62 +1,279 @@
 from __future__ import annotations
 
+import base64
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from decimal import Decimal
-from typing import Any, Dict, Sequence
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+from http.client import HTTPConnection, HTTPResponse, HTTPSConnection
+from http.client import HTTPException as HTTPClientError
+from typing import Any, Dict, Iterable, Mapping, Sequence
+from urllib.parse import unquote, urlencode, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass_environment
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from domain.entities.candle import Candle
 from domain.exceptions.errors import DataProviderError
 from domain.services.market_data_service import MarketDataService
 from domain.value_objects.timeframe import Timeframe
+from infrastructure.decimals import parse_decimal
+
+# Twelve Data interval strings, resolved once per timeframe
+_INTERVALS: Dict[Timeframe, str] = {tf: tf.to_twelvedata_interval() for tf in Timeframe}
+
+# Statuses whose Location is followed, as urlopen does for GET requests
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
 
 
 class SimpleResponse:
-    def __init__(self, status_code: int, text: str) -> None:
+    """HTTP response holding the raw body; JSON is parsed straight from bytes."""
+
+    def __init__(
+        self, status_code: int, body: bytes, headers: Mapping[str, str] | None = None
+    ) -> None:
         self.status_code = status_code
-        self.text = text
+        self.body = body
+        self.headers: Mapping[str, str] = headers or {}
 
-    def json(self) -> dict:
-        import json
+    @property
+    def text(self) -> str:
+        """Body decoded as UTF-8, only needed for error messages."""
+        return self.body.decode("utf-8", errors="replace")
 
-        return json.loads(self.text)
+    def json(self) -> dict:
+        if orjson:
+            return orjson.loads(self.body)
+        return json.loads(self.body)
 
 
 class UrlLibSession:
-    """Lightweight HTTP client using the standard library."""
+    """
+    Lightweight HTTP client using the standard library.
+
+    Connections are kept alive and pooled per host, so repeated calls to the
+    same API reuse an open socket instead of paying a TCP/TLS handshake each
+    time. Network errors and transient statuses (429/5xx) are retried with
+    exponential backoff. A session can be shared between threads.
+
+    As with urlopen, redirects are followed and proxies come from
+    ``getproxies()`` (HTTP_PROXY, HTTPS_PROXY, NO_PROXY) unless ``proxies``
+    is given: plain HTTP is sent to the proxy, HTTPS is tunnelled through it
+    with CONNECT.
+    """
 
-    def get(self, url: str, params: Dict[str, Any] | None = None, timeout: int | None = None) -> SimpleResponse:
+    def __init__(
+        self,
+        max_idle_per_host: int = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.3,
+        retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504}),
+        max_redirects: int = 10,
+        proxies: Mapping[str, str] | None = None,
+    ) -> None:
+        self._max_idle_per_host = max_idle_per_host
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.retry_statuses = retry_statuses
+        self.max_redirects = max_redirects
+        self.proxies = dict(getproxies() if proxies is None else proxies)
+        self._routes: Dict[tuple[str, str, int | None], tuple[str, int, Dict[str, str]] | None] = {}
+        self._idle: Dict[tuple[str, str, int | None], list[HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        url: str,
+        params: Dict[str, Any] | None = None,
+        timeout: int | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> SimpleResponse:
         query = urlencode(params or {})
-        full_url = f"{url}?{query}" if query else url
-        request = Request(full_url)
-        try:
-            with urlopen(request, timeout=timeout) as response:
-                text = response.read().decode("utf-8")
-                status = response.getcode()
-                return SimpleResponse(status_code=status, text=text)
-        except HTTPError as exc:
-            text = exc.read().decode("utf-8")
-            return SimpleResponse(status_code=exc.code, text=text)
-        except URLError as exc:  # pragma: no cover - network layer unlikely in tests
-            raise DataProviderError(f"Network error contacting Twelve Data: {exc.reason}") from exc
+        if query:
+            url = f"{url}{'&' if urlsplit(url).query else '?'}{query}"
+
+        for _ in range(self.max_redirects + 1):
+            response = self._get_once(url, timeout, headers)
+            location = response.headers.get("Location")
+            if response.status_code not in _REDIRECT_STATUSES or not location:
+                return response
+            url = urljoin(url, location)
+
+        raise DataProviderError(f"Too many redirects contacting Twelve Data, last to {url}")
+
+    def _get_once(
+        self, url: str, timeout: int | None, headers: Mapping[str, str] | None
+    ) -> SimpleResponse:
+        """Fetch a single URL, retrying network errors and transient statuses."""
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname or "", parts.port)
+        target = f"{parts.path or '/'}?{parts.query}" if parts.query else parts.path or "/"
+
+        proxy = self._proxy_for(key)
+        if proxy is not None and parts.scheme == "http":
+            # A forward proxy takes the absolute URL; HTTPS goes through the CONNECT tunnel instead
+            target = parts._replace(fragment="").geturl()
+            headers = {**proxy[2], **(headers or {})}
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(self.backoff_factor * 2 ** (attempt - 1))
+
+            try:
+                response, body = self._request(key, target, timeout, headers)
+            except (OSError, HTTPClientError) as exc:
+                if attempt == self.max_retries:
+                    raise DataProviderError(f"Network error contacting Twelve Data: {exc}") from exc
+                continue
+
+            if response.status not in self.retry_statuses or attempt == self.max_retries:
+                break
+
+        return SimpleResponse(status_code=response.status, body=body, headers=response.headers)
+
+    def _request(
+        self,
+        key: tuple[str, str, int | None],
+        target: str,
+        timeout: int | None,
+        headers: Mapping[str, str] | None,
+    ) -> tuple[HTTPResponse, bytes]:
+        """Send one request over a pooled connection, returning it to the pool after."""
+        connection = self._acquire(key)
+        reused = connection is not None
+        if connection is None:
+            connection = self._connect(key, timeout)
+
+        while True:
+            try:
+                response, body = self._send(connection, target, timeout, headers)
+                break
+            except (OSError, HTTPClientError):
+                connection.close()
+                if not reused:
+                    raise
+                # The server may have dropped an idle keep-alive socket; retry on a fresh one
+                connection, reused = self._connect(key, timeout), False
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(key, connection)
+        return response, body
+
+    def close(self) -> None:
+        """Close every idle pooled connection."""
+        with self._lock:
+            pools, self._idle = self._idle, {}
+        for pool in pools.values():
+            for connection in pool:
+                connection.close()
+
+    @staticmethod
+    def _send(
+        connection: HTTPConnection,
+        target: str,
+        timeout: int | None,
+        headers: Mapping[str, str] | None,
+    ) -> tuple[HTTPResponse, bytes]:
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+        connection.request("GET", target, headers=dict(headers or {}))
+        response = connection.getresponse()
+        # Reading the full body frees the connection for reuse
+        return response, response.read()
+
+    def _acquire(self, key: tuple[str, str, int | None]) -> HTTPConnection | None:
+        with self._lock:
+            pool = self._idle.get(key)
+            return pool.pop() if pool else None
+
+    def _connect(self, key: tuple[str, str, int | None], timeout: int | None) -> HTTPConnection:
+        scheme, host, port = key
+        connection_class = HTTPSConnection if scheme == "https" else HTTPConnection
+        proxy = self._proxy_for(key)
+        if proxy is None:
+            return connection_class(host, port, timeout=timeout)
+
+        proxy_host, proxy_port, proxy_headers = proxy
+        connection = connection_class(proxy_host, proxy_port, timeout=timeout)
+        if scheme == "https":
+            connection.set_tunnel(host, port, headers=proxy_headers)
+        return connection
+
+    def _proxy_for(self, key: tuple[str, str, int | None]) -> tuple[str, int, Dict[str, str]] | None:
+        """Proxy host, port and auth headers for a target, or None to connect directly."""
+        if key in self._routes:
+            return self._routes[key]
+
+        scheme, host, _ = key
+        proxy = self.proxies.get(scheme)
+        route = None
+        if proxy and not proxy_bypass_environment(host, self.proxies):
+            if "://" not in proxy:
+                proxy = f"http://{proxy}"
+            parts = urlsplit(proxy)
+            proxy_headers: Dict[str, str] = {}
+            if parts.username is not None:
+                credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+                token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+                proxy_headers["Proxy-Authorization"] = f"Basic {token}"
+            route = (parts.hostname or "", parts.port or 80, proxy_headers)
+
+        self._routes[key] = route
+        return route
+
+    def _release(self, key: tuple[str, str, int | None], connection: HTTPConnection) -> None:
+        with self._lock:
+            pool = self._idle.setdefault(key, [])
+            if len(pool) < self._max_idle_per_host:
+                pool.append(connection)
+                return
+        connection.close()
 
 
 class TwelveDataClient(MarketDataService):
-    """Data provider that integrates with the Twelve Data API."""
+    """
+    Data provider that integrates with the Twelve Data API.
+
+    When the server returns ETag or Last-Modified validators, the payload is
+    remembered per request and later requests are sent as conditional GETs;
+    a 304 Not Modified answer reuses the remembered values.
+    """
 
     def __init__(
         self,
         api_key: str,
         base_url: str = "https://api.twelvedata.com",
         session: UrlLibSession | None = None,
+        max_conditional_entries: int = 32,
+        max_concurrency: int = 4,
     ) -> None:
         if not api_key:
             raise ValueError("Twelve Data API key is required")
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.session = session or UrlLibSession()
+        # Request defaults shared by every time_series call
+        self._base_params: Dict[str, Any] = {
+            "apikey": api_key,
+            "format": "JSON",
+            "dp": 8,
+            "timezone": "UTC",
+        }
+        self._time_series_url = f"{self.base_url}/time_series"
+        self.max_conditional_entries = max_conditional_entries
+        # Request params -> (validator headers, values) for conditional requests
+        self._conditional: OrderedDict[tuple, tuple[Dict[str, str], list[Dict[str, Any]]]] = OrderedDict()
+        self._conditional_lock = threading.Lock()
+        # Upper bound on requests in flight for get_many_historical_ohlcv
+        self.max_concurrency = max_concurrency
 
     def get_latest_ohlcv(
         self, symbol: str, timeframe: Timeframe, count: int = 1
@@ -64,7 +281,46 @@ class TwelveDataClient(MarketDataService):
         values = self._fetch_time_series(
             symbol=symbol, timeframe=timeframe, params={"outputsize": count}
         )
-        return [self._build_candle(symbol, timeframe, entry) for entry in values]
+        return self._build_candles(symbol, timeframe, values)
+
+    def get_many_latest_ohlcv(
+        self, symbols: Iterable[str], timeframe: Timeframe, count: int = 1
+    ) -> dict[str, Sequence[Candle]]:
+        """
+        Fetch the latest candles for several symbols in one request.
+
+        Twelve Data accepts comma-separated symbols and answers with one
+        payload per symbol; symbols it reports an error for are left out.
+        """
+        unique_symbols = list(dict.fromkeys(symbols))
+        if len(unique_symbols) < 2:
+            return super().get_many_latest_ohlcv(unique_symbols, timeframe, count)
+
+        params = {
+            "symbol": ",".join(unique_symbols),
+            "interval": _INTERVALS[timeframe],
+            **self._base_params,
+            "outputsize": count,
+        }
+        response = self.session.get(self._time_series_url, params=params, timeout=10)
+        if response.status_code != 200:
+            raise DataProviderError(
+                f"Twelve Data returned HTTP {response.status_code}: {response.text}"
+            )
+
+        payload = response.json()
+        if payload.get("status") == "error":
+            raise DataProviderError(payload.get("message", "Unknown Twelve Data error"))
+
+        candles_by_symbol: dict[str, Sequence[Candle]] = {}
+        for symbol in unique_symbols:
+            entry = payload.get(symbol)
+            if not isinstance(entry, dict) or entry.get("status") == "error":
+                continue
+            values = entry.get("values")
+            if isinstance(values, list):
+                candles_by_symbol[symbol] = self._build_candles(symbol, timeframe, values)
+        return candles_by_symbol
 
     def get_historical_ohlcv(
         self,
@@ -83,22 +339,61 @@ class TwelveDataClient(MarketDataService):
             params["outputsize"] = limit
 
         values = self._fetch_time_series(symbol=symbol, timeframe=timeframe, params=params)
-        return [self._build_candle(symbol, timeframe, entry) for entry in values]
+        return self._build_candles(symbol, timeframe, values)
+
+    def get_many_historical_ohlcv(
+        self,
+        symbols: Iterable[str],
+        timeframe: Timeframe,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int | None = None,
+    ) -> dict[str, Sequence[Candle]]:
+        """
+        Fetch the same historical window for several symbols concurrently.
+
+        Each symbol is its own request over the shared keep-alive session,
+        with at most ``max_concurrency`` of them in flight.
+        """
+        unique_symbols = list(dict.fromkeys(symbols))
+        if len(unique_symbols) < 2:
+            return super().get_many_historical_ohlcv(unique_symbols, timeframe, start, end, limit)
+
+        def fetch(symbol: str) -> Sequence[Candle]:
+            return self.get_historical_ohlcv(symbol, timeframe, start=start, end=end, limit=limit)
+
+        workers = max(1, min(self.max_concurrency, len(unique_symbols)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(unique_symbols, executor.map(fetch, unique_symbols)))
+
+    def close(self) -> None:
+        """Close the keep-alive connections pooled by the HTTP session."""
+        self.session.close()
 
     def _fetch_time_series(
         self, symbol: str, timeframe: Timeframe, params: Dict[str, Any]
     ) -> list[Dict[str, Any]]:
         merged_params = {
             "symbol": symbol,
-            "interval": timeframe.to_twelvedata_interval(),
-            "apikey": self.api_key,
-            "format": "JSON",
-            "dp": 8,
-            "timezone": "UTC",
+            "interval": _INTERVALS[timeframe],
+            **self._base_params,
+            **params,
         }
-        merged_params.update(params)
 
-        response = self.session.get(f"{self.base_url}/time_series", params=merged_params, timeout=10)
+        request_key = tuple(sorted(merged_params.items()))
+        with self._conditional_lock:
+            remembered = self._conditional.get(request_key)
+
+        request_kwargs: Dict[str, Any] = {}
+        if remembered is not None:
+            request_kwargs["headers"] = remembered[0]
+
+        response = self.session.get(
+            self._time_series_url, params=merged_params, timeout=10, **request_kwargs
+        )
+        if response.status_code == 304 and remembered is not None:
+            return remembered[1]
+
         if response.status_code != 200:
             raise DataProviderError(
                 f"Twelve Data returned HTTP {response.status_code}: {response.text}"
@@ -112,18 +407,75 @@ class TwelveDataClient(MarketDataService):
         if not isinstance(values, list):
             raise DataProviderError("Unexpected Twelve Data payload; missing 'values'")
 
+        self._remember_validators(request_key, getattr(response, "headers", None), values)
         return values
 
+    def _remember_validators(
+        self,
+        request_key: tuple,
+        headers: Mapping[str, str] | None,
+        values: list[Dict[str, Any]],
+    ) -> None:
+        """Keep the payload for a conditional re-request if the server sent validators."""
+        if not headers:
+            return
+
+        validators: Dict[str, str] = {}
+        etag = headers.get("ETag")
+        if etag:
+            validators["If-None-Match"] = etag
+        last_modified = headers.get("Last-Modified")
+        if last_modified:
+            validators["If-Modified-Since"] = last_modified
+        if not validators:
+            return
+
+        with self._conditional_lock:
+            self._conditional[request_key] = (validators, values)
+            self._conditional.move_to_end(request_key)
+            while len(self._conditional) > self.max_conditional_entries:
+                self._conditional.popitem(last=False)
+
+    def _build_candles(
+        self, symbol: str, timeframe: Timeframe, values: list[Dict[str, Any]]
+    ) -> list[Candle]:
+        """
+        Convert a time_series payload into candles in a single pass.
+
+        Parsers are bound to locals and candles are built positionally, so
+        the per-entry cost is the parsing itself rather than method calls
+        and attribute lookups. A malformed entry falls back to the
+        per-entry builder to report which candle was invalid.
+        """
+        parse_timestamp = datetime.fromisoformat
+        to_decimal = parse_decimal
+        try:
+            return [
+                Candle(
+                    symbol,
+                    timeframe,
+                    parse_timestamp(entry["datetime"]),
+                    to_decimal(entry["open"]),
+                    to_decimal(entry["high"]),
+                    to_decimal(entry["low"]),
+                    to_decimal(entry["close"]),
+                    to_decimal(entry.get("volume", "0")),
+                )
+                for entry in values
+            ]
+        except (KeyError, ValueError, TypeError):
+            return [self._build_candle(symbol, timeframe, entry) for entry in values]
+
     def _build_candle(
         self, symbol: str, timeframe: Timeframe, entry: Dict[str, Any]
     ) -> Candle:
         try:
             timestamp = datetime.fromisoformat(entry["datetime"])
-            open_price = Decimal(entry["open"])
-            high = Decimal(entry["high"])
-            low = Decimal(entry["low"])
-            close = Decimal(entry["close"])
-            volume = Decimal(entry.get("volume", "0"))
+            open_price = parse_decimal(entry["open"])
+            high = parse_decimal(entry["high"])
+            low = parse_decimal(entry["low"])
+            close = parse_decimal(entry["close"])
+            volume = parse_decimal(entry.get("volume", "0"))
         except (KeyError, ValueError, TypeError) as exc:
             raise DataProviderError(f"Invalid candle entry from Twelve Data: {entry}") from exc
 
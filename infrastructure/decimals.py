@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8192, typed=True)
+def parse_decimal(value: str) -> Decimal:
+    """Parse a price string, reusing the Decimal for values seen recently."""
+    return Decimal(value)
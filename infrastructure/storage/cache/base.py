@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any
+
+from domain.entities.candle import Candle
+from domain.value_objects.timeframe import Timeframe
+from infrastructure.decimals import parse_decimal
+
+
+_TIMEFRAMES: dict[str, Timeframe] = {tf.value: tf for tf in Timeframe}
+
+
+class BaseCandleCache(ABC):
+    """Storage-agnostic cache of candle lists keyed by symbol, timeframe and count."""
+
+    @abstractmethod
+    def get(self, symbol: str, timeframe: Timeframe, count: int) -> list[Candle] | None:
+        """Return the cached candles, or None on a miss."""
+
+    @abstractmethod
+    def set(self, symbol: str, timeframe: Timeframe, count: int, candles: list[Candle]) -> None:
+        """Store candles, replacing any previous entry for the same key."""
+
+    @staticmethod
+    def _build_key(symbol: str, timeframe: Timeframe, count: int) -> str:
+        return f"{symbol}_{timeframe.value}_{count}"
+
+    @staticmethod
+    def _serialize_candles(candles: list[Candle]) -> list[dict[str, Any]]:
+        """Serialize a candle list to JSON-ready dicts in one comprehension."""
+        return [
+            {
+                "symbol": candle.symbol,
+                "timeframe": candle.timeframe.value,
+                "timestamp": candle.timestamp.isoformat(),
+                "open": str(candle.open),
+                "high": str(candle.high),
+                "low": str(candle.low),
+                "close": str(candle.close),
+                "volume": str(candle.volume),
+            }
+            for candle in candles
+        ]
+
+    @staticmethod
+    def _deserialize_candles(items: list[dict[str, Any]]) -> list[Candle]:
+        """Rebuild a candle list positionally, without per-item method dispatch."""
+        timeframes = _TIMEFRAMES
+        parse_timestamp = datetime.fromisoformat
+        to_decimal = parse_decimal
+        return [
+            Candle(
+                data["symbol"],
+                timeframes[data["timeframe"]],
+                parse_timestamp(data["timestamp"]),
+                to_decimal(data["open"]),
+                to_decimal(data["high"]),
+                to_decimal(data["low"]),
+                to_decimal(data["close"]),
+                to_decimal(data["volume"]),
+            )
+            for data in items
+        ]
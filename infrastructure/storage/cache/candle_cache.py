@@ -1,16 +1,23 @@
 from __future__ import annotations
 
 import json
+import os
+import tempfile
 from datetime import datetime
-from decimal import Decimal
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from domain.entities.candle import Candle
 from domain.value_objects.timeframe import Timeframe
+from infrastructure.storage.cache.base import BaseCandleCache
 
 
-class CandleCache:
+class CandleCache(BaseCandleCache):
     """File-based cache to reuse fetched candles across controllers."""
 
     def __init__(self, cache_file: str | Path) -> None:
@@ -27,7 +34,7 @@ class CandleCache:
             return None
 
         try:
-            return [self._deserialize_candle(item) for item in entry["candles"]]
+            return self._deserialize_candles(entry["candles"])
         except (KeyError, ValueError):
             return None
 
@@ -36,47 +43,29 @@ class CandleCache:
         key = self._build_key(symbol, timeframe, count)
         cache[key] = {
             "stored_at": datetime.utcnow().isoformat(),
-            "candles": [self._serialize_candle(c) for c in candles],
+            "candles": self._serialize_candles(candles),
         }
         self._write_cache(cache)
 
     def _read_cache(self) -> dict[str, Any]:
         if not self.cache_file.exists():
             return {}
+        raw = self.cache_file.read_bytes()
         try:
-            return json.loads(self.cache_file.read_text())
+            return orjson.loads(raw) if orjson else json.loads(raw)
         except json.JSONDecodeError:
             return {}
 
     def _write_cache(self, data: dict[str, Any]) -> None:
-        self.cache_file.write_text(json.dumps(data))
-
-    @staticmethod
-    def _build_key(symbol: str, timeframe: Timeframe, count: int) -> str:
-        return f"{symbol}_{timeframe.value}_{count}"
-
-    @staticmethod
-    def _serialize_candle(candle: Candle) -> dict[str, Any]:
-        return {
-            "symbol": candle.symbol,
-            "timeframe": candle.timeframe.value,
-            "timestamp": candle.timestamp.isoformat(),
-            "open": str(candle.open),
-            "high": str(candle.high),
-            "low": str(candle.low),
-            "close": str(candle.close),
-            "volume": str(candle.volume),
-        }
-
-    @staticmethod
-    def _deserialize_candle(data: dict[str, Any]) -> Candle:
-        return Candle(
-            symbol=data["symbol"],
-            timeframe=Timeframe(data["timeframe"]),
-            timestamp=datetime.fromisoformat(data["timestamp"]),
-            open=Decimal(data["open"]),
-            high=Decimal(data["high"]),
-            low=Decimal(data["low"]),
-            close=Decimal(data["close"]),
-            volume=Decimal(data["volume"]),
-        )
+        # Write a sibling temp file and swap it in, so an interrupted write
+        # never leaves a truncated cache that would read back as empty
+        raw = orjson.dumps(data) if orjson else json.dumps(data).encode("utf-8")
+        with tempfile.NamedTemporaryFile(
+            dir=self.cache_file.parent, prefix=f".{self.cache_file.name}.", delete=False
+        ) as tmp:
+            tmp.write(raw)
+        try:
+            os.replace(tmp.name, self.cache_file)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+
+from domain.entities.candle import Candle
+from domain.value_objects.timeframe import Timeframe
+from infrastructure.storage.cache.base import BaseCandleCache
+
+
+class MemoryCandleCache(BaseCandleCache):
+    """
+    Bounded in-process LRU layered over another candle cache.
+
+    Hits are served from memory without touching the backend. By default
+    writes go through to the backend and refresh the memory entry, so both
+    layers stay consistent. With ``flush_interval`` set, writes only update
+    memory and a background thread copies them to the backend every
+    ``flush_interval`` seconds; call ``close`` to write what is left and
+    ``start`` to resume background flushing afterwards.
+    """
+
+    def __init__(
+        self,
+        backend: BaseCandleCache,
+        maxsize: int = 256,
+        ttl_seconds: float | None = None,
+        flush_interval: float | None = None,
+    ) -> None:
+        self.backend = backend
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.flush_interval = flush_interval
+        self._memory: OrderedDict[str, tuple[float, list[Candle]]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Deferred backend writes, newest entry per key
+        self._pending: dict[str, tuple[str, Timeframe, int, list[Candle]]] = {}
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._flusher: threading.Thread | None = None
+        self.start()
+
+    def start(self) -> None:
+        """Start the background flusher if writes are deferred and it is not running."""
+        if self.flush_interval is None or self._flusher is not None:
+            return
+        self._stop.clear()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="candle-cache-flush", daemon=True
+        )
+        self._flusher.start()
+
+    def get(self, symbol: str, timeframe: Timeframe, count: int) -> list[Candle] | None:
+        key = self._build_key(symbol, timeframe, count)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                stored_at, candles = entry
+                if self.ttl_seconds is None or time.monotonic() - stored_at <= self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    return list(candles)
+                del self._memory[key]
+
+            # Evicted from memory but not yet written to the backend
+            pending = self._pending.get(key)
+            if pending is not None:
+                return list(pending[3])
+
+        candles = self.backend.get(symbol=symbol, timeframe=timeframe, count=count)
+        if candles:
+            self._remember(key, candles)
+        return candles
+
+    def set(self, symbol: str, timeframe: Timeframe, count: int, candles: list[Candle]) -> None:
+        key = self._build_key(symbol, timeframe, count)
+        if self.flush_interval is None:
+            self.backend.set(symbol=symbol, timeframe=timeframe, count=count, candles=candles)
+            self._remember(key, candles)
+            return
+
+        self._remember(key, candles)
+        with self._lock:
+            self._pending[key] = (symbol, timeframe, count, list(candles))
+
+    def flush(self) -> None:
+        """Write every deferred entry to the backend."""
+        with self._flush_lock:
+            with self._lock:
+                items = list(self._pending.items())
+            for key, entry in items:
+                symbol, timeframe, count, candles = entry
+                # Failures leave this and later entries pending for the next flush
+                self.backend.set(symbol=symbol, timeframe=timeframe, count=count, candles=candles)
+                # Entries stay readable from _pending until written; keep any newer write
+                with self._lock:
+                    if self._pending.get(key) is entry:
+                        del self._pending[key]
+
+    def close(self) -> None:
+        """Stop the background flusher and write any deferred entries."""
+        if self._flusher is not None:
+            self._stop.set()
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
+
+    def _flush_periodically(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                # Entries stay pending; the backend gets another chance next interval
+                continue
+
+    def _remember(self, key: str, candles: list[Candle]) -> None:
+        with self._lock:
+            self._memory[key] = (time.monotonic(), list(candles))
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.maxsize:
+                self._memory.popitem(last=False)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from domain.entities.candle import Candle
+from domain.value_objects.timeframe import Timeframe
+from infrastructure.storage.cache.base import BaseCandleCache
+
+
+class SqliteCandleCache(BaseCandleCache):
+    """
+    SQLite-backed candle cache storing one row per key.
+
+    Reads and writes touch only the requested entry, unlike the JSON file
+    cache which parses and rewrites every entry on each call. Entries older
+    than ttl_seconds are evicted when read. A closed cache can be opened
+    again with ``open``.
+    """
+
+    def __init__(self, cache_file: str | Path, ttl_seconds: float | None = None) -> None:
+        self.cache_file = Path(cache_file)
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self.open()
+
+    def open(self) -> None:
+        """Connect to the database file; does nothing if already connected."""
+        with self._lock:
+            if self._connection is not None:
+                return
+            connection = sqlite3.connect(self.cache_file, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS candles ("
+                "key TEXT PRIMARY KEY, stored_at REAL NOT NULL, payload BLOB NOT NULL)"
+            )
+            self._connection = connection
+
+    def get(self, symbol: str, timeframe: Timeframe, count: int) -> list[Candle] | None:
+        key = self._build_key(symbol, timeframe, count)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT stored_at, payload FROM candles WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            stored_at, payload = row
+            if self.ttl_seconds is not None and time.time() - stored_at > self.ttl_seconds:
+                self._connection.execute("DELETE FROM candles WHERE key = ?", (key,))
+                return None
+
+        try:
+            items = orjson.loads(payload) if orjson else json.loads(payload)
+            return self._deserialize_candles(items)
+        except (KeyError, ValueError):
+            return None
+
+    def set(self, symbol: str, timeframe: Timeframe, count: int, candles: list[Candle]) -> None:
+        key = self._build_key(symbol, timeframe, count)
+        items = self._serialize_candles(candles)
+        payload = orjson.dumps(items) if orjson else json.dumps(items).encode("utf-8")
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO candles (key, stored_at, payload) VALUES (?, ?, ?)",
+                (key, time.time(), payload),
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
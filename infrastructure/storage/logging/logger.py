@@ -1,16 +1,23 @@
 import logging
 from typing import Optional
 
+# Shared by every configured logger instead of building one per call
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
+)
+
 
 def get_logger(name: str, level: int = logging.INFO, handler: Optional[logging.Handler] = None) -> logging.Logger:
-    """Configure and return a logger."""
+    """
+    Configure and return a logger.
+
+    Guard debug messages that are expensive to build with
+    ``logger.isEnabledFor(logging.DEBUG)``.
+    """
     logger = logging.getLogger(name)
     if not logger.handlers:
         logger.setLevel(level)
         stream_handler = handler or logging.StreamHandler()
-        formatter = logging.Formatter(
-            fmt="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
-        )
-        stream_handler.setFormatter(formatter)
+        stream_handler.setFormatter(_FORMATTER)
         logger.addHandler(stream_handler)
     return logger
@@ -1,8 +1,13 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional
 
 
-class TradeResponse(BaseModel):
+class ResponseModel(BaseModel):
+    """Base for API responses: immutable once built and strict about fields."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class TradeResponse(ResponseModel):
     """Modelo para as decisões que o bot visualiza no gráfico."""
     time: int
     type: str  # 'buy' ou 'sell'
@@ -10,7 +15,7 @@ class TradeResponse(BaseModel):
     text: str
 
 
-class CandleResponse(BaseModel):
+class CandleResponse(ResponseModel):
     """Candle data formatted for Lightweight Charts."""
     time: int  # Unix timestamp in seconds
     open: float
@@ -20,7 +25,13 @@ class CandleResponse(BaseModel):
     volume: float
 
 
-class MarketDataResponse(BaseModel):
+class TimeframeResponse(ResponseModel):
+    """Selectable timeframe option."""
+    value: str
+    label: str
+
+
+class MarketDataResponse(ResponseModel):
     """Combined response with candles and trading decisions."""
     candles: List[CandleResponse]
     decisions: List[TradeResponse]
@@ -28,7 +39,7 @@ class MarketDataResponse(BaseModel):
 
 # ============ Indicator Models ============
 
-class SwingPointResponse(BaseModel):
+class SwingPointResponse(ResponseModel):
     """Swing point for chart markers (HH, HL, LL, LH)."""
     time: int  # Unix timestamp
     price: float
@@ -39,7 +50,7 @@ class SwingPointResponse(BaseModel):
     text: str  # label text
 
 
-class BOSResponse(BaseModel):
+class BOSResponse(ResponseModel):
     """Break of Structure for chart visualization."""
     type: str  # 'BULLISH' or 'BEARISH'
     broken_swing_time: int
@@ -49,18 +60,22 @@ class BOSResponse(BaseModel):
     color: str
 
 
-class TrendIndicatorResponse(BaseModel):
-    """Full trend indicator response for chart overlay."""
+class TrendInfoResponse(ResponseModel):
+    """Simplified trend info (without swings for display)."""
     trend: str  # 'UP', 'DOWN', 'UNDEFINED'
     confidence: float
     reason: str
+
+
+class TrendIndicatorResponse(TrendInfoResponse):
+    """Full trend indicator response for chart overlay."""
     swings: List[SwingPointResponse]
     last_bos: Optional[BOSResponse] = None
 
 
 # ============ Liquidity Indicator Models ============
 
-class AccumulationZoneResponse(BaseModel):
+class AccumulationZoneResponse(ResponseModel):
     """Accumulation zone for chart rectangle visualization."""
     start_time: int  # Unix timestamp
     end_time: int  # Unix timestamp
@@ -74,7 +89,7 @@ class AccumulationZoneResponse(BaseModel):
     invalidated_at: Optional[int] = None
 
 
-class LiquidityIndicatorResponse(BaseModel):
+class LiquidityIndicatorResponse(ResponseModel):
     """Full liquidity indicator response with accumulation zones."""
     accumulation_zones: List[AccumulationZoneResponse]
     total_zones: int
@@ -82,14 +97,7 @@ class LiquidityIndicatorResponse(BaseModel):
 
 # ============ Unified Analysis Response ============
 
-class TrendInfoResponse(BaseModel):
-    """Simplified trend info (without swings for display)."""
-    trend: str  # 'UP', 'DOWN', 'UNDEFINED'
-    confidence: float
-    reason: str
-
-
-class FullAnalysisResponse(BaseModel):
+class FullAnalysisResponse(ResponseModel):
     """
     Unified response containing candles and all indicator analyses.
     
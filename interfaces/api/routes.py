@@ -1,32 +1,54 @@
 from __future__ import annotations
 
-from typing import List
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Iterable, List, Sequence
 
-from fastapi import FastAPI, Query, HTTPException
+from fastapi import FastAPI, Query, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response, StreamingResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from application.policies.timeframe_policy import TimeframePolicy
 from application.use_cases.detect_liquidity_zones import DetectLiquidityZones
 from application.use_cases.fetch_historical_ohlcv import FetchHistoricalOHLCV
 from application.use_cases.fetch_latest_ohlcv import FetchLatestOHLCV
 from application.use_cases.generate_trading_decision import GenerateTradingDecision
+from domain.entities.candle import Candle
+from domain.entities.ohlcv_arrays import OhlcvArrays
 from domain.exceptions.errors import DataProviderError
-from domain.indicators.trend import TrendIndicator, SwingClassification
+from domain.indicators.liquidity import AccumulationZone
+from domain.indicators.trend import TrendIndicator, TrendSignal, SwingClassification, SwingPoint
 from domain.services.trend_detector import TrendDetector
 from domain.value_objects.timeframe import Timeframe
 from domain.value_objects.trend import TrendDirection
 from infrastructure.config.liquidity import load_liquidity_settings
 from infrastructure.config.settings import load_settings
 from infrastructure.data_providers.twelve_data_client import TwelveDataClient
-from infrastructure.storage.cache.candle_cache import CandleCache
+from infrastructure.storage.cache.memory_candle_cache import MemoryCandleCache
+from infrastructure.storage.cache.sqlite_candle_cache import SqliteCandleCache
 from infrastructure.storage.logging.logger import get_logger
 from interfaces.controllers.market_data_controller import MarketDataController
+from interfaces.controllers.symbol_batcher import SymbolBatcher
 from interfaces.controllers.trading_controller import TradingController
 from interfaces.controllers.liquidity_controller import LiquidityController
 from .models import (
     TradeResponse, 
     CandleResponse as CandleResponseModel, 
     MarketDataResponse,
+    TimeframeResponse,
     SwingPointResponse,
     BOSResponse,
     TrendIndicatorResponse,
@@ -37,6 +59,215 @@ from .models import (
 )
 
 
+@lru_cache(maxsize=65536)
+def _epoch_seconds(moment: datetime) -> int:
+    """
+    Unix seconds for a timestamp in API responses.
+
+    Memoized because the same cached candles are served on every refresh,
+    and each datetime.timestamp() call on a naive value goes through mktime.
+    Sized for a dozen 5000-candle series: each refresh walks a series in
+    order, and an LRU smaller than the combined series would miss on every
+    lookup.
+    """
+    return int(moment.timestamp())
+
+
+# Chart marker (color, position, shape, text) per swing classification
+_SWING_STYLE: dict[SwingClassification, tuple[str, str, str, str]] = {
+    SwingClassification.HIGHER_HIGH: ("#22c55e", "aboveBar", "arrowUp", "HH"),  # green
+    SwingClassification.HIGHER_LOW: ("#22c55e", "belowBar", "arrowUp", "HL"),  # green
+    SwingClassification.LOWER_LOW: ("#ef4444", "belowBar", "arrowDown", "LL"),  # red
+    SwingClassification.LOWER_HIGH: ("#ef4444", "aboveBar", "arrowDown", "LH"),  # red
+    SwingClassification.SWING_HIGH: ("#a855f7", "aboveBar", "circle", "SH"),  # purple
+    SwingClassification.SWING_LOW: ("#a855f7", "belowBar", "circle", "SL"),  # purple
+}
+
+# Trade side and label for a confident trend; other directions produce no decision
+_TREND_DECISIONS: dict[TrendDirection, tuple[str, str]] = {
+    TrendDirection.UP: ("buy", "Tendência de alta"),
+    TrendDirection.DOWN: ("sell", "Tendência de queda"),
+}
+
+_TIMEFRAMES: dict[str, Timeframe] = {tf.value: tf for tf in Timeframe}
+_INVALID_TIMEFRAME_DETAIL = f"Invalid timeframe. Valid options: {list(_TIMEFRAMES)}"
+
+
+def _parse_timeframe(value: str) -> Timeframe:
+    """Resolve a timeframe query parameter, answering 400 for unknown values."""
+    tf = _TIMEFRAMES.get(value)
+    if tf is None:
+        raise HTTPException(status_code=400, detail=_INVALID_TIMEFRAME_DETAIL)
+    return tf
+
+
+def _candles_to_payload(candles: Iterable[Candle]) -> List[dict[str, Any]]:
+    """
+    Convert candles into chart candle dicts, keeping the order they are given in.
+
+    Plain dicts in the CandleResponse shape are several times cheaper to build
+    than model instances and serialize directly with orjson.
+    """
+    epoch_seconds = _epoch_seconds
+    to_float = float
+    return [
+        {
+            "time": epoch_seconds(candle.timestamp),
+            "open": to_float(candle.open),
+            "high": to_float(candle.high),
+            "low": to_float(candle.low),
+            "close": to_float(candle.close),
+            "volume": to_float(candle.volume),
+        }
+        for candle in candles
+    ]
+
+
+def _swing_to_response(swing: SwingPoint) -> SwingPointResponse:
+    """Convert a classified swing into its chart marker."""
+    color, position, shape, text = _SWING_STYLE[swing.classification]
+    return SwingPointResponse.model_construct(
+        time=_epoch_seconds(swing.timestamp),
+        price=float(swing.price),
+        type=swing.classification.value,
+        position=position,
+        color=color,
+        shape=shape,
+        text=text,
+    )
+
+
+def _zone_to_response(zone: AccumulationZone) -> AccumulationZoneResponse:
+    """Convert a detected accumulation zone into its chart rectangle."""
+    return AccumulationZoneResponse.model_construct(
+        start_time=_epoch_seconds(zone.start_time),
+        end_time=_epoch_seconds(zone.end_time),
+        high_price=float(zone.high_price),
+        low_price=float(zone.low_price),
+        candle_count=zone.candle_count,
+        strength=zone.strength,
+        safe_zone_high=float(zone.safe_zone_high),
+        safe_zone_low=float(zone.safe_zone_low),
+        is_active=zone.is_active,
+        invalidated_at=_epoch_seconds(zone.invalidated_at) if zone.invalidated_at else None,
+    )
+
+
+def _dumps(content: Any) -> bytes:
+    if orjson:
+        return orjson.dumps(content)
+    return json.dumps(content, separators=(",", ":")).encode("utf-8")
+
+
+# Static body of /api/timeframes, encoded once; it only changes with a deploy
+_TIMEFRAMES_PAYLOAD = _dumps([{"value": tf.value, "label": tf.value} for tf in Timeframe])
+_TIMEFRAMES_HEADERS = {"Cache-Control": "public, max-age=86400"}
+
+
+def _candles_etag(candles: Sequence[Candle]) -> str:
+    """
+    Weak validator for responses derived from a newest-first candle list.
+
+    The newest candle's values are included because the forming bar keeps
+    changing until its interval closes.
+    """
+    newest = candles[0]
+    return (
+        f'W/"{_epoch_seconds(newest.timestamp)}-{len(candles)}-'
+        f'{newest.open}-{newest.high}-{newest.low}-{newest.close}-{newest.volume}"'
+    )
+
+
+# Length of timeframes whose candles open on fixed multiples of the epoch
+_BUCKET_SECONDS: dict[Timeframe, int] = {
+    Timeframe.ONE_MINUTE: 60,
+    Timeframe.FIVE_MINUTES: 300,
+    Timeframe.FIFTEEN_MINUTES: 900,
+    Timeframe.THIRTY_MINUTES: 1800,
+    Timeframe.FORTYFIVE_MINUTES: 2700,
+    Timeframe.ONE_HOUR: 3600,
+    Timeframe.TWO_HOURS: 7200,
+    Timeframe.FOUR_HOURS: 14400,
+    Timeframe.EIGHT_HOURS: 28800,
+    Timeframe.ONE_DAY: 86400,
+}
+
+
+def _cache_control(timeframe: Timeframe, freshness_seconds: float) -> str:
+    """
+    Let browsers and proxies reuse a candle response until the sooner of the
+    next candle opening and the server refetching its cached candles, which
+    happens ``freshness_seconds`` from now.
+    """
+    max_age = int(freshness_seconds)
+    bucket = _BUCKET_SECONDS.get(timeframe)
+    if bucket:
+        max_age = min(max_age, bucket - int(time.time()) % bucket)
+    return f"public, max-age={max_age}"
+
+
+# Streamed bodies larger than this are not kept for reuse, so they are never held twice
+_MAX_MEMO_BODY_BYTES = 256 * 1024
+
+
+def _is_not_modified(request: Request, etag: str) -> bool:
+    """Whether the client's If-None-Match already names this representation."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags or etag[2:] in tags
+
+
+def _not_modified(headers: dict[str, str]) -> Response:
+    return Response(status_code=304, headers=headers)
+
+
+def _json_response(content: Any, headers: dict[str, str] | None = None) -> Response:
+    """
+    Serialize a payload the handler already built in its response_model shape.
+
+    Returning a Response makes FastAPI skip validating and re-serializing the
+    content; response_model is still used for the OpenAPI schema.
+    """
+    return Response(content=_dumps(content), media_type="application/json", headers=headers)
+
+
+async def _stream_candles(
+    candles: Sequence[Candle],
+    batch_size: int = 1000,
+    on_complete: Callable[[bytes], None] | None = None,
+    max_complete_bytes: int = _MAX_MEMO_BODY_BYTES,
+) -> AsyncIterator[bytes]:
+    """
+    Emit newest-first candles as a chronological JSON array, one batch at a time.
+
+    The first batch is on the wire while later ones are still being built.
+    With ``on_complete``, the encoded chunks are also kept and the callback
+    receives the whole body after the last chunk is sent, unless the body
+    grows past ``max_complete_bytes``; larger bodies are never held in full.
+    """
+    chunks: list[bytes] | None = [] if on_complete is not None else None
+    kept_bytes = 0
+    prefix = b"["
+    for end in range(len(candles), 0, -batch_size):
+        batch = _dumps(_candles_to_payload(reversed(candles[max(0, end - batch_size):end])))
+        # Splice batch arrays together by dropping their own brackets
+        chunk = prefix + batch[1:-1]
+        if chunks is not None:
+            kept_bytes += len(chunk)
+            if kept_bytes <= max_complete_bytes:
+                chunks.append(chunk)
+            else:
+                chunks = None
+        yield chunk
+        prefix = b","
+    chunk = b"]" if prefix == b"," else b"[]"
+    yield chunk
+    if chunks is not None:
+        chunks.append(chunk)
+        on_complete(b"".join(chunks))
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
@@ -46,10 +277,29 @@ def create_app() -> FastAPI:
     if not settings.api_key:
         raise ValueError("TWELVEDATA_API_KEY environment variable is required")
 
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        """Size the worker pool on startup and release shared resources on shutdown."""
+        # Reopen what an earlier shutdown of this app closed
+        candle_store.open()
+        candle_cache.start()
+        # asyncio.to_thread uses the loop's default executor, which is sized for
+        # CPU count; provider calls mostly wait on the network, so allow more threads
+        executor = ThreadPoolExecutor(max_workers=settings.worker_threads, thread_name_prefix="api-worker")
+        asyncio.get_running_loop().set_default_executor(executor)
+        yield
+        # Let running handlers finish before closing what they use
+        executor.shutdown(wait=True)
+        # Write cache entries still waiting for the background flush
+        candle_cache.close()
+        candle_store.close()
+        data_provider.close()
+
     app = FastAPI(
         title="Demo Bot API",
         description="API para dados de mercado com visualização em Lightweight Charts",
         version="1.0.0",
+        lifespan=lifespan,
     )
     
     app.add_middleware(
@@ -58,6 +308,8 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    # Candle payloads are repetitive JSON and shrink several times over
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
     # Setup dependencies
     timeframe_policy = TimeframePolicy()
@@ -65,7 +317,9 @@ def create_app() -> FastAPI:
         api_key=settings.api_key,
         base_url=settings.base_url or "https://api.twelvedata.com",
     )
-    candle_cache = CandleCache(cache_file=".cache/candles.json")
+    # Requests update memory only; SQLite is written in the background
+    candle_store = SqliteCandleCache(cache_file=".cache/candles.sqlite3")
+    candle_cache = MemoryCandleCache(candle_store, flush_interval=5.0)
     fetch_latest = FetchLatestOHLCV(
         market_data_service=data_provider,
         timeframe_policy=timeframe_policy,
@@ -74,13 +328,21 @@ def create_app() -> FastAPI:
         market_data_service=data_provider,
         timeframe_policy=timeframe_policy,
     )
-    trend_detector = TrendDetector()
+    # TrendIndicator keeps per-run swing state, so each thread reuses its own instance
+    trend_indicators = threading.local()
+
+    def analyze_trend(candles_chronological: Sequence[Candle] | OhlcvArrays) -> TrendSignal:
+        indicator = getattr(trend_indicators, "indicator", None)
+        if indicator is None:
+            indicator = trend_indicators.indicator = TrendIndicator()
+        return indicator.analyze(candles_chronological)
+
     liquidity_settings = load_liquidity_settings()
     
     # Setup use cases
     generate_decision = GenerateTradingDecision(
         fetch_latest=fetch_latest,
-        trend_detector=trend_detector,
+        trend_detector_factory=TrendDetector,
     )
     detect_liquidity_zones = DetectLiquidityZones(liquidity_settings=liquidity_settings)
     
@@ -89,56 +351,80 @@ def create_app() -> FastAPI:
         fetch_latest=fetch_latest,
         fetch_historical=fetch_historical,
         candle_cache=candle_cache,
+        symbol_batcher=SymbolBatcher(fetch_latest),
     )
     trading_controller = TradingController(generate_decision=generate_decision)
     liquidity_controller = LiquidityController(detect_liquidity_zones=detect_liquidity_zones)
 
+    def cache_headers(candles: Sequence[Candle], symbol: str, tf: Timeframe, count: int) -> dict[str, str]:
+        """ETag and Cache-Control for a response built from newest-first candles."""
+        freshness = market_data_controller.remaining_freshness(symbol, tf, count)
+        return {"ETag": _candles_etag(candles), "Cache-Control": _cache_control(tf, freshness)}
+
+    # Encoded /api/candles bodies of recent snapshots, keyed by their ETag.
+    # Only touched from the event loop, so no lock is needed.
+    candle_bodies: OrderedDict[tuple[str, Timeframe, str], bytes] = OrderedDict()
+    max_candle_bodies = 32
+
+    def remember_candle_body(key: tuple[str, Timeframe, str], body: bytes) -> None:
+        candle_bodies[key] = body
+        candle_bodies.move_to_end(key)
+        while len(candle_bodies) > max_candle_bodies:
+            candle_bodies.popitem(last=False)
+
+    async def fetch_latest_candles(symbol: str, tf: Timeframe, count: int) -> List[Candle]:
+        """Fetch the latest candles (newest first) without blocking the event loop."""
+        return await asyncio.to_thread(
+            market_data_controller.latest, symbol=symbol, timeframe=tf, count=count
+        )
+
     @app.get("/api/candles", response_model=List[CandleResponseModel])
     async def get_candles(
+        request: Request,
         symbol: str = Query(..., description="Asset symbol (e.g., BTC/USD, AAPL)"),
         timeframe: str = Query("1min", description="Candle timeframe"),
         count: int = Query(5000, ge=1, le=5000, description="Number of candles to fetch (default: 5000)"),
-    ) -> List[CandleResponseModel]:
+    ) -> Response:
         """Fetch OHLCV candles for a given symbol and timeframe."""
-        try:
-            tf = Timeframe(timeframe)
-        except ValueError:
-            valid = [t.value for t in Timeframe]
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid timeframe. Valid options: {valid}",
-            )
+        tf = _parse_timeframe(timeframe)
 
         try:
-            candles = market_data_controller.latest(symbol=symbol, timeframe=tf, count=count)
+            candles = await fetch_latest_candles(symbol, tf, count)
         except DataProviderError as e:
             logger.error("Data provider error: %s", str(e))
             raise HTTPException(status_code=502, detail=str(e))
 
-        # Convert to Lightweight Charts format (sorted by time ascending)
-        result = [
-            CandleResponseModel(
-                time=int(candle.timestamp.timestamp()),
-                open=float(candle.open),
-                high=float(candle.high),
-                low=float(candle.low),
-                close=float(candle.close),
-                volume=float(candle.volume),
-            )
-            for candle in reversed(list(candles))
-        ]
+        if not candles:
+            return Response(content=b"[]", media_type="application/json")
+
+        headers = cache_headers(candles, symbol, tf, count)
+        if _is_not_modified(request, headers["ETag"]):
+            return _not_modified(headers)
 
-        return result
+        # An unchanged snapshot is answered with the body encoded the first time
+        body_key = (symbol, tf, headers["ETag"])
+        body = candle_bodies.get(body_key)
+        if body is not None:
+            candle_bodies.move_to_end(body_key)
+            return Response(content=body, media_type="application/json", headers=headers)
 
-    @app.get("/api/timeframes")
-    async def get_timeframes():
+        # Convert to Lightweight Charts format (sorted by time ascending)
+        return StreamingResponse(
+            _stream_candles(candles, on_complete=lambda body: remember_candle_body(body_key, body)),
+            media_type="application/json",
+            headers=headers,
+        )
+
+    @app.get("/api/timeframes", response_model=List[TimeframeResponse])
+    async def get_timeframes() -> Response:
         """Return available timeframes."""
-        return [{"value": tf.value, "label": tf.value} for tf in Timeframe]
+        return Response(content=_TIMEFRAMES_PAYLOAD, media_type="application/json", headers=_TIMEFRAMES_HEADERS)
 
     logger.info("FastAPI app created successfully")
 
     @app.get("/api/market-data", response_model=MarketDataResponse)
     async def get_market_data(
+        request: Request,
         symbol: str = Query("BTC/USD", description="Asset symbol (e.g., BTC/USD, AAPL)"),
         timeframe: str = Query("1min", description="Candle timeframe"),
         count: int = Query(5000, ge=1, le=5000, description="Number of candles to fetch"),
@@ -150,79 +436,59 @@ def create_app() -> FastAPI:
         Retorna tanto os candles para o gráfico quanto as decisões do bot baseadas
         nos mesmos candles, evitando fazer duas chamadas separadas.
         """
-        try:
-            tf = Timeframe(timeframe)
-        except ValueError:
-            valid = [t.value for t in Timeframe]
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid timeframe. Valid options: {valid}",
-            )
+        tf = _parse_timeframe(timeframe)
 
         try:
             # Buscar candles (apenas UMA chamada à API)
-            candles = market_data_controller.latest(symbol=symbol, timeframe=tf, count=count)
-            candles_list = list(candles)
+            candles_list = await fetch_latest_candles(symbol, tf, count)
             
             if not candles_list:
-                return MarketDataResponse(candles=[], decisions=[])
+                return MarketDataResponse.model_construct(candles=[], decisions=[])
+            
+            headers = cache_headers(candles_list, symbol, tf, count)
+            if _is_not_modified(request, headers["ETag"]):
+                return _not_modified(headers)
             
             # Converter candles para formato da API
-            candles_response = [
-                CandleResponseModel(
-                    time=int(candle.timestamp.timestamp()),
-                    open=float(candle.open),
-                    high=float(candle.high),
-                    low=float(candle.low),
-                    close=float(candle.close),
-                    volume=float(candle.volume),
-                )
-                for candle in reversed(candles_list)
-            ]
+            candles_response = _candles_to_payload(reversed(candles_list))
             
             # Gerar decisões usando os mesmos candles (sem fazer outra chamada à API)
             # Criamos um detector temporário para análise
             temp_detector = TrendDetector()
-            trend_result = temp_detector.analyze(candles_list)
+            trend_result = await asyncio.to_thread(temp_detector.analyze, candles_list)
             
             last_candle = candles_list[-1]
             current_price = float(last_candle.close)
-            last_candle_time = int(last_candle.timestamp.timestamp())
+            # candles_response is chronological, so its first entry is this candle
+            last_candle_time = candles_response[0]["time"]
             
             decisions_response: list[TradeResponse] = []
             
             # Strategy 1: Use trend analysis if confidence is sufficient
             if trend_result.confidence > 0.3:
-                if trend_result.trend == TrendDirection.UP:
-                    decisions_response.append(
-                        TradeResponse(
-                            time=last_candle_time,
-                            type="buy",
-                            price=current_price,
-                            text=f"Tendência de alta (conf: {trend_result.confidence:.2f})",
-                        )
-                    )
-                elif trend_result.trend == TrendDirection.DOWN:
+                decision = _TREND_DECISIONS.get(trend_result.trend)
+                if decision is not None:
+                    side, label = decision
                     decisions_response.append(
-                        TradeResponse(
+                        TradeResponse.model_construct(
                             time=last_candle_time,
-                            type="sell",
+                            type=side,
                             price=current_price,
-                            text=f"Tendência de queda (conf: {trend_result.confidence:.2f})",
+                            text=f"{label} (conf: {trend_result.confidence:.2f})",
                         )
                     )
             else:
                 # Strategy 2: Fallback to simple momentum analysis
                 if len(candles_list) >= 20:
-                    recent_prices = [float(c.close) for c in candles_list[-10:]]
-                    previous_prices = [float(c.close) for c in candles_list[-20:-10]]
-                    recent_avg = sum(recent_prices) / len(recent_prices)
-                    previous_avg = sum(previous_prices) / len(previous_prices)
+                    # One conversion pass over the 20 closes, split into the two windows
+                    closes = [float(c.close) for c in candles_list[-20:]]
+                    previous_avg = sum(closes[:10]) / 10
+                    recent_avg = sum(closes[10:]) / 10
                     
                     if recent_avg > previous_avg * 1.001:
                         percent_change = ((recent_avg / previous_avg - 1) * 100)
                         decisions_response.append(
-                            TradeResponse(
+                            TradeResponse.model_construct(
                                 time=last_candle_time,
                                 type="buy",
                                 price=current_price,
@@ -232,7 +498,7 @@ def create_app() -> FastAPI:
                     elif recent_avg < previous_avg * 0.999:
                         percent_change = ((recent_avg / previous_avg - 1) * 100)
                         decisions_response.append(
-                            TradeResponse(
+                            TradeResponse.model_construct(
                                 time=last_candle_time,
                                 type="sell",
                                 price=current_price,
@@ -243,9 +509,12 @@ def create_app() -> FastAPI:
             logger.info("Generated %d candles and %d decisions for symbol %s", 
                        len(candles_response), len(decisions_response), symbol)
             
-            return MarketDataResponse(
-                candles=candles_response,
-                decisions=decisions_response
+            return _json_response(
+                {
+                    "candles": candles_response,
+                    "decisions": [decision.model_dump() for decision in decisions_response],
+                },
+                headers=headers,
             )
             
         except DataProviderError as e:
@@ -267,23 +536,18 @@ def create_app() -> FastAPI:
         Para economizar chamadas à API, use o endpoint /api/market-data que retorna
         candles + decisões em uma única chamada.
         """
-        try:
-            tf = Timeframe(timeframe)
-        except ValueError:
-            valid = [t.value for t in Timeframe]
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid timeframe. Valid options: {valid}",
-            )
+        tf = _parse_timeframe(timeframe)
 
         try:
             # Use controller to get trading decisions
             # O use case já busca os candles necessários (200 por padrão)
-            decisions = trading_controller.get_decisions(symbol=symbol, timeframe=tf)
+            decisions = await asyncio.to_thread(
+                trading_controller.get_decisions, symbol=symbol, timeframe=tf
+            )
             
             # Convert domain decisions to API response model
             result = [
-                TradeResponse(
+                TradeResponse.model_construct(
                     time=decision.time,
                     type=decision.type,
                     price=decision.price,
@@ -316,22 +580,14 @@ def create_app() -> FastAPI:
         - last_bos: última quebra de estrutura detectada
         - trend: direção da tendência (UP, DOWN, UNDEFINED)
         """
-        try:
-            tf = Timeframe(timeframe)
-        except ValueError:
-            valid = [t.value for t in Timeframe]
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid timeframe. Valid options: {valid}",
-            )
+        tf = _parse_timeframe(timeframe)
 
         try:
             # Fetch candles
-            candles = market_data_controller.latest(symbol=symbol, timeframe=tf, count=count)
-            candles_list = list(candles)
+            candles_list = await fetch_latest_candles(symbol, tf, count)
             
             if len(candles_list) < 10:
-                return TrendIndicatorResponse(
+                return TrendIndicatorResponse.model_construct(
                     trend="UNDEFINED",
                     confidence=0.0,
                     reason="Dados insuficientes para análise",
@@ -340,66 +596,23 @@ def create_app() -> FastAPI:
                 )
             
             # Reverse to have oldest first (chronological order)
-            candles_list = list(reversed(candles_list))
+            candles_list = candles_list[::-1]
             
             # Run trend indicator
-            trend_indicator = TrendIndicator()
-            signal = trend_indicator.analyze(candles_list)
+            signal = await asyncio.to_thread(analyze_trend, candles_list)
             
             # Convert swings to response format with chart styling
-            swings_response: List[SwingPointResponse] = []
-            for swing in signal.swings:
-                # Determine color and position based on classification
-                if swing.classification == SwingClassification.HIGHER_HIGH:
-                    color = "#22c55e"  # green
-                    position = "aboveBar"
-                    shape = "arrowUp"
-                    text = "HH"
-                elif swing.classification == SwingClassification.HIGHER_LOW:
-                    color = "#22c55e"  # green
-                    position = "belowBar"
-                    shape = "arrowUp"
-                    text = "HL"
-                elif swing.classification == SwingClassification.LOWER_LOW:
-                    color = "#ef4444"  # red
-                    position = "belowBar"
-                    shape = "arrowDown"
-                    text = "LL"
-                elif swing.classification == SwingClassification.LOWER_HIGH:
-                    color = "#ef4444"  # red
-                    position = "aboveBar"
-                    shape = "arrowDown"
-                    text = "LH"
-                elif swing.classification == SwingClassification.SWING_HIGH:
-                    color = "#a855f7"  # purple
-                    position = "aboveBar"
-                    shape = "circle"
-                    text = "SH"
-                else:  # SWING_LOW
-                    color = "#a855f7"  # purple
-                    position = "belowBar"
-                    shape = "circle"
-                    text = "SL"
-                
-                swings_response.append(SwingPointResponse(
-                    time=int(swing.timestamp.timestamp()),
-                    price=float(swing.price),
-                    type=swing.classification.value,
-                    position=position,
-                    color=color,
-                    shape=shape,
-                    text=text,
-                ))
+            swings_response = [_swing_to_response(swing) for swing in signal.swings]
             
             # Convert BOS to response format
             bos_response = None
             if signal.last_bos:
                 bos = signal.last_bos
-                bos_response = BOSResponse(
+                bos_response = BOSResponse.model_construct(
                     type=bos.type.value,
-                    broken_swing_time=int(bos.broken_swing.timestamp.timestamp()),
+                    broken_swing_time=_epoch_seconds(bos.broken_swing.timestamp),
                     broken_swing_price=float(bos.broken_swing.price),
-                    break_time=int(bos.break_timestamp.timestamp()),
+                    break_time=_epoch_seconds(bos.break_timestamp),
                     break_price=float(bos.break_price),
                     color="#22c55e" if bos.is_bullish else "#ef4444",
                 )
@@ -409,7 +622,7 @@ def create_app() -> FastAPI:
                 symbol, signal.trend.value, signal.confidence, len(swings_response)
             )
             
-            return TrendIndicatorResponse(
+            return TrendIndicatorResponse.model_construct(
                 trend=signal.trend.value,
                 confidence=signal.confidence,
                 reason=signal.reason,
@@ -441,54 +654,33 @@ def create_app() -> FastAPI:
         - high_price/low_price: limites do range
         - strength: força da acumulação (0-1)
         """
-        try:
-            tf = Timeframe(timeframe)
-        except ValueError:
-            valid = [t.value for t in Timeframe]
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid timeframe. Valid options: {valid}",
-            )
+        tf = _parse_timeframe(timeframe)
 
         try:
             # Fetch candles
-            candles = market_data_controller.latest(symbol=symbol, timeframe=tf, count=count)
-            candles_list = list(candles)
+            candles_list = await fetch_latest_candles(symbol, tf, count)
             
             if len(candles_list) < liquidity_settings.min_candles_in_zone:
-                return LiquidityIndicatorResponse(
+                return LiquidityIndicatorResponse.model_construct(
                     accumulation_zones=[],
                     total_zones=0,
                 )
             
             # Reverse to have oldest first (chronological order)
-            candles_list = list(reversed(candles_list))
+            candles_list = candles_list[::-1]
             
             # Run liquidity indicator via use case/controller
-            signal = liquidity_controller.analyze(candles_list)
+            signal = await asyncio.to_thread(liquidity_controller.analyze, candles_list)
             
             # Convert accumulation zones to response format
-            zones_response: List[AccumulationZoneResponse] = []
-            for zone in signal.accumulation_zones:
-                zones_response.append(AccumulationZoneResponse(
-                    start_time=int(zone.start_time.timestamp()),
-                    end_time=int(zone.end_time.timestamp()),
-                    high_price=float(zone.high_price),
-                    low_price=float(zone.low_price),
-                    candle_count=zone.candle_count,
-                    strength=zone.strength,
-                    safe_zone_high=float(zone.safe_zone_high),
-                    safe_zone_low=float(zone.safe_zone_low),
-                    is_active=zone.is_active,
-                    invalidated_at=int(zone.invalidated_at.timestamp()) if zone.invalidated_at else None,
-                ))
+            zones_response = [_zone_to_response(zone) for zone in signal.accumulation_zones]
             
             logger.info(
                 "Liquidity indicator for %s: %d accumulation zones detected",
                 symbol, len(zones_response)
             )
             
-            return LiquidityIndicatorResponse(
+            return LiquidityIndicatorResponse.model_construct(
                 accumulation_zones=zones_response,
                 total_zones=len(zones_response),
             )
@@ -502,6 +694,7 @@ def create_app() -> FastAPI:
 
     @app.get("/api/analysis", response_model=FullAnalysisResponse)
     async def get_full_analysis(
+        request: Request,
         symbol: str = Query("BTC/USD", description="Asset symbol"),
         timeframe: str = Query("1min", description="Candle timeframe"),
         count: int = Query(5000, ge=50, le=5000, description="Number of candles to analyze"),
@@ -517,24 +710,16 @@ def create_app() -> FastAPI:
         - trend: Análise de tendência (UP, DOWN, UNDEFINED)
         - accumulation_zones: Zonas de acumulação detectadas
         """
-        try:
-            tf = Timeframe(timeframe)
-        except ValueError:
-            valid = [t.value for t in Timeframe]
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid timeframe. Valid options: {valid}",
-            )
+        tf = _parse_timeframe(timeframe)
 
         try:
             # ===== UMA ÚNICA CHAMADA À API EXTERNA =====
-            candles = market_data_controller.latest(symbol=symbol, timeframe=tf, count=count)
-            candles_list = list(candles)
+            candles_list = await fetch_latest_candles(symbol, tf, count)
             
             if len(candles_list) < 10:
-                return FullAnalysisResponse(
+                return FullAnalysisResponse.model_construct(
                     candles=[],
-                    trend=TrendInfoResponse(
+                    trend=TrendInfoResponse.model_construct(
                         trend="UNDEFINED",
                         confidence=0.0,
                         reason="Dados insuficientes para análise",
@@ -542,59 +727,42 @@ def create_app() -> FastAPI:
                     accumulation_zones=[],
                 )
             
-            # Converter candles para formato da API (ordenado cronologicamente)
-            candles_response = [
-                CandleResponseModel(
-                    time=int(candle.timestamp.timestamp()),
-                    open=float(candle.open),
-                    high=float(candle.high),
-                    low=float(candle.low),
-                    close=float(candle.close),
-                    volume=float(candle.volume),
-                )
-                for candle in reversed(candles_list)
-            ]
+            headers = cache_headers(candles_list, symbol, tf, count)
+            if _is_not_modified(request, headers["ETag"]):
+                return _not_modified(headers)
             
-            # Candles em ordem cronológica para os indicadores
-            candles_chronological = list(reversed(candles_list))
+            # Candles em ordem cronológica para os indicadores e para o gráfico
+            candles_chronological = candles_list[::-1]
+            candles_response = _candles_to_payload(candles_chronological)
             
-            # ===== ANÁLISE DE TENDÊNCIA (local, sem chamada externa) =====
-            trend_indicator = TrendIndicator()
-            trend_signal = trend_indicator.analyze(candles_chronological)
+            # ===== ANÁLISES DE TENDÊNCIA E LIQUIDEZ (locais, em paralelo) =====
+            # Float columns built once for this request; the liquidity indicator works on Decimals
+            arrays = OhlcvArrays.from_candles(candles_chronological)
+            trend_signal, liquidity_signal = await asyncio.gather(
+                asyncio.to_thread(analyze_trend, arrays),
+                asyncio.to_thread(liquidity_controller.analyze, candles_chronological),
+            )
             
-            trend_response = TrendInfoResponse(
+            trend_response = TrendInfoResponse.model_construct(
                 trend=trend_signal.trend.value,
                 confidence=trend_signal.confidence,
                 reason=trend_signal.reason,
             )
             
-            # ===== ANÁLISE DE LIQUIDEZ (local, sem chamada externa) =====
-            liquidity_signal = liquidity_controller.analyze(candles_chronological)
-            
-            zones_response: List[AccumulationZoneResponse] = []
-            for zone in liquidity_signal.accumulation_zones:
-                zones_response.append(AccumulationZoneResponse(
-                    start_time=int(zone.start_time.timestamp()),
-                    end_time=int(zone.end_time.timestamp()),
-                    high_price=float(zone.high_price),
-                    low_price=float(zone.low_price),
-                    candle_count=zone.candle_count,
-                    strength=zone.strength,
-                    safe_zone_high=float(zone.safe_zone_high),
-                    safe_zone_low=float(zone.safe_zone_low),
-                    is_active=zone.is_active,
-                    invalidated_at=int(zone.invalidated_at.timestamp()) if zone.invalidated_at else None,
-                ))
+            zones_response = [_zone_to_response(zone) for zone in liquidity_signal.accumulation_zones]
             
             logger.info(
                 "Full analysis for %s: trend=%s (%.2f), %d accumulation zones",
                 symbol, trend_signal.trend.value, trend_signal.confidence, len(zones_response)
             )
             
-            return FullAnalysisResponse(
-                candles=candles_response,
-                trend=trend_response,
-                accumulation_zones=zones_response,
+            return _json_response(
+                {
+                    "candles": candles_response,
+                    "trend": trend_response.model_dump(),
+                    "accumulation_zones": [zone.model_dump() for zone in zones_response],
+                },
+                headers=headers,
             )
             
         except DataProviderError as e:
@@ -1,44 +1,93 @@
 from __future__ import annotations
 
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Sequence
+from typing import Mapping, Sequence
 
 from application.use_cases.fetch_historical_ohlcv import FetchHistoricalOHLCV
 from application.use_cases.fetch_latest_ohlcv import FetchLatestOHLCV
 from domain.entities.candle import Candle
 from domain.value_objects.timeframe import Timeframe
-from infrastructure.storage.cache.candle_cache import CandleCache
+from infrastructure.storage.cache.base import BaseCandleCache
+from interfaces.controllers.symbol_batcher import SymbolBatcher
 
+# Seconds cached candles are served before the provider is asked again
+DEFAULT_FRESHNESS_SECONDS: dict[Timeframe, float] = {
+    Timeframe.ONE_MINUTE: 30,
+    Timeframe.FIVE_MINUTES: 60,
+    Timeframe.FIFTEEN_MINUTES: 120,
+    Timeframe.THIRTY_MINUTES: 180,
+    Timeframe.FORTYFIVE_MINUTES: 240,
+    Timeframe.ONE_HOUR: 300,
+    Timeframe.TWO_HOURS: 600,
+    Timeframe.FOUR_HOURS: 900,
+    Timeframe.EIGHT_HOURS: 1800,
+    Timeframe.ONE_DAY: 3600,
+    Timeframe.ONE_WEEK: 3600,
+    Timeframe.ONE_MONTH: 3600,
+}
+
+# Fetch times kept for at most this many (symbol, timeframe, count) keys
+MAX_TRACKED_KEYS = 1024
 
 class MarketDataController:
-    """Controller that coordinates market data use cases."""
+    """
+    Controller that coordinates market data use cases.
+
+    Cached candles are reused until they are older than the freshness window
+    of their timeframe; candles whose fetch time this process does not know,
+    such as ones persisted by an earlier run, are refetched. Concurrent requests for the same key share the
+    result of a single in-flight load instead of each fetching. With a
+    ``symbol_batcher``, provider calls for different symbols arriving close
+    together are merged into one multi-symbol request.
+    """
 
     def __init__(
         self,
         fetch_latest: FetchLatestOHLCV,
         fetch_historical: FetchHistoricalOHLCV,
-        candle_cache: CandleCache | None = None,
+        candle_cache: BaseCandleCache | None = None,
+        freshness_seconds: Mapping[Timeframe, float] | None = None,
+        symbol_batcher: SymbolBatcher | None = None,
     ) -> None:
         self.fetch_latest = fetch_latest
         self.fetch_historical = fetch_historical
         self.candle_cache = candle_cache
+        if freshness_seconds is None:
+            freshness_seconds = DEFAULT_FRESHNESS_SECONDS
+        self.freshness_seconds = dict(freshness_seconds)
+        self.symbol_batcher = symbol_batcher
+        self._fetched_at: OrderedDict[tuple[str, Timeframe, int], float] = OrderedDict()
+        self._fetched_at_lock = threading.Lock()
+        self._inflight: dict[tuple[str, Timeframe, int], Future[list[Candle]]] = {}
+        self._inflight_lock = threading.Lock()
 
-    def latest(self, symbol: str, timeframe: Timeframe, count: int = 1) -> Sequence[Candle]:
-        candles: Sequence[Candle] | None = None
-
-        if self.candle_cache:
-            cached = self.candle_cache.get(symbol=symbol, timeframe=timeframe, count=count)
-            if cached:
-                candles = cached
+    def latest(self, symbol: str, timeframe: Timeframe, count: int = 1) -> list[Candle]:
+        """Return a fresh list of the latest candles, newest first."""
+        key = (symbol, timeframe, count)
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = Future()
 
-        if candles is None:
-            candles = list(self.fetch_latest.execute(symbol=symbol, timeframe=timeframe, count=count))
-
-        if self.candle_cache and candles:
-            # Always rewrite cache for every request to keep file fresh.
-            self.candle_cache.set(symbol=symbol, timeframe=timeframe, count=count, candles=list(candles))
+        if not leader:
+            return list(flight.result())
 
-        return candles
+        try:
+            candles = self._load_latest(key)
+        except Exception as exc:
+            flight.set_exception(exc)
+            raise
+        else:
+            flight.set_result(candles)
+            return list(candles)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
 
     def historical(
         self,
@@ -55,3 +104,60 @@ class MarketDataController:
             end=end,
             limit=limit,
         )
+
+    def historical_many(
+        self,
+        symbols: Sequence[str],
+        timeframe: Timeframe,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int | None = None,
+    ) -> dict[str, Sequence[Candle]]:
+        return self.fetch_historical.execute_many(
+            symbols=symbols,
+            timeframe=timeframe,
+            start=start,
+            end=end,
+            limit=limit,
+        )
+
+    def remaining_freshness(self, symbol: str, timeframe: Timeframe, count: int = 1) -> float:
+        """Seconds until candles fetched for this key are refetched; 0 when unknown or stale."""
+        with self._fetched_at_lock:
+            fetched_at = self._fetched_at.get((symbol, timeframe, count))
+        if fetched_at is None:
+            return 0.0
+        return max(self.freshness_seconds.get(timeframe, 0) - (time.monotonic() - fetched_at), 0.0)
+
+    def _is_fresh(self, key: tuple[str, Timeframe, int]) -> bool:
+        with self._fetched_at_lock:
+            fetched_at = self._fetched_at.get(key)
+        if fetched_at is None:
+            return False
+        return time.monotonic() - fetched_at <= self.freshness_seconds.get(key[1], 0)
+
+    def _mark_fetched(self, key: tuple[str, Timeframe, int]) -> None:
+        with self._fetched_at_lock:
+            self._fetched_at[key] = time.monotonic()
+            self._fetched_at.move_to_end(key)
+            while len(self._fetched_at) > MAX_TRACKED_KEYS:
+                self._fetched_at.popitem(last=False)
+
+    def _load_latest(self, key: tuple[str, Timeframe, int]) -> list[Candle]:
+        symbol, timeframe, count = key
+
+        if self.candle_cache and self._is_fresh(key):
+            cached = self.candle_cache.get(symbol=symbol, timeframe=timeframe, count=count)
+            if cached:
+                return cached
+
+        if self.symbol_batcher:
+            candles = self.symbol_batcher.load(symbol=symbol, timeframe=timeframe, count=count)
+        else:
+            candles = list(self.fetch_latest.execute(symbol=symbol, timeframe=timeframe, count=count))
+        self._mark_fetched(key)
+
+        if self.candle_cache and candles:
+            self.candle_cache.set(symbol=symbol, timeframe=timeframe, count=count, candles=list(candles))
+
+        return candles
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future
+
+from application.use_cases.fetch_latest_ohlcv import FetchLatestOHLCV
+from domain.entities.candle import Candle
+from domain.value_objects.timeframe import Timeframe
+
+
+class SymbolBatcher:
+    """
+    Groups latest-candle loads for different symbols into one provider call.
+
+    The first load for a (timeframe, count) pair opens a batch and waits
+    ``window_seconds`` for loads of other symbols to join it, then fetches
+    every collected symbol with a single multi-symbol request.
+    """
+
+    def __init__(self, fetch_latest: FetchLatestOHLCV, window_seconds: float = 0.01) -> None:
+        self.fetch_latest = fetch_latest
+        self.window_seconds = window_seconds
+        self._pending: dict[tuple[Timeframe, int], dict[str, Future[list[Candle]]]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, symbol: str, timeframe: Timeframe, count: int = 1) -> list[Candle]:
+        """Return the latest candles for ``symbol``, newest first."""
+        key = (timeframe, count)
+        with self._lock:
+            batch = self._pending.get(key)
+            leader = batch is None
+            if leader:
+                batch = self._pending[key] = {}
+            flight = batch.get(symbol)
+            if flight is None:
+                flight = batch[symbol] = Future()
+
+        if leader:
+            time.sleep(self.window_seconds)
+            with self._lock:
+                batch = self._pending.pop(key)
+            self._dispatch(timeframe, count, batch)
+
+        return list(flight.result())
+
+    def _dispatch(
+        self, timeframe: Timeframe, count: int, batch: dict[str, Future[list[Candle]]]
+    ) -> None:
+        try:
+            results = self.fetch_latest.execute_many(symbols=list(batch), timeframe=timeframe, count=count)
+        except Exception as exc:
+            for flight in batch.values():
+                flight.set_exception(exc)
+            return
+
+        for symbol, flight in batch.items():
+            candles = results.get(symbol)
+            if candles is None:
+                # Left out of the batch answer; fetch it alone so its own error surfaces
+                try:
+                    candles = self.fetch_latest.execute(symbol=symbol, timeframe=timeframe, count=count)
+                except Exception as exc:
+                    flight.set_exception(exc)
+                    continue
+            flight.set_result(list(candles))
@@ -30,7 +30,11 @@ def build_controller(api_key: str, base_url: str | None = None) -> MarketDataCon
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Fetch OHLCV data from Twelve Data.")
-    parser.add_argument("--symbol", required=True, help="Asset symbol (e.g., AAPL, BTC/USD).")
+    parser.add_argument(
+        "--symbol",
+        required=True,
+        help="Asset symbol (e.g., AAPL, BTC/USD); comma-separate several with --historical.",
+    )
     parser.add_argument(
         "--timeframe",
         default=Timeframe.ONE_MINUTE.value,
@@ -67,13 +71,15 @@ def main() -> None:
     if args.historical:
         start = datetime.fromisoformat(args.start) if args.start else None
         end = datetime.fromisoformat(args.end) if args.end else None
-        candles = controller.historical(
-            symbol=args.symbol,
+        symbols = [symbol.strip() for symbol in args.symbol.split(",") if symbol.strip()]
+        series = controller.historical_many(
+            symbols=symbols,
             timeframe=timeframe,
             start=start,
             end=end,
             limit=args.limit,
         )
+        candles = [candle for symbol in symbols for candle in series.get(symbol, [])]
     else:
         candles = controller.latest(symbol=args.symbol, timeframe=timeframe, count=args.count)
 
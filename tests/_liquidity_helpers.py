@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+
+from domain.entities.candle import Candle
+from domain.value_objects.timeframe import Timeframe
+
+_VOLUME = Decimal("1")
+
+
+def build_candle(ts: datetime, low: str, high: str, close: str) -> Candle:
+    """One-minute test candle that opens at its close price."""
+    close_price = Decimal(close)
+    return Candle(
+        symbol="TEST",
+        timeframe=Timeframe.ONE_MINUTE,
+        timestamp=ts,
+        open=close_price,
+        high=Decimal(high),
+        low=Decimal(low),
+        close=close_price,
+        volume=_VOLUME,
+    )
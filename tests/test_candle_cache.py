@@ -4,12 +4,16 @@ from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
 import json
+import threading
 import time
 
 from domain.entities.candle import Candle
 from domain.value_objects.timeframe import Timeframe
 from infrastructure.storage.cache.candle_cache import CandleCache
+from infrastructure.storage.cache.memory_candle_cache import MemoryCandleCache
+from infrastructure.storage.cache.sqlite_candle_cache import SqliteCandleCache
 from interfaces.controllers.market_data_controller import MarketDataController
+from interfaces.controllers.symbol_batcher import SymbolBatcher
 
 
 def test_candle_cache_round_trip(tmp_path: Path):
@@ -37,6 +41,159 @@ def test_candle_cache_round_trip(tmp_path: Path):
     assert loaded[0] == candle
 
 
+def test_sqlite_candle_cache_round_trip(tmp_path: Path):
+    cache = SqliteCandleCache(cache_file=tmp_path / "candles.sqlite3")
+    candle = Candle(
+        symbol="TEST",
+        timeframe=Timeframe.ONE_MINUTE,
+        timestamp=datetime(2024, 1, 1, 0, 0),
+        open=Decimal("1.0"),
+        high=Decimal("1.1"),
+        low=Decimal("0.9"),
+        close=Decimal("1.05"),
+        volume=Decimal("100"),
+    )
+
+    assert cache.get(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=2) is None
+
+    cache.set(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=2, candles=[candle])
+    loaded = cache.get(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=2)
+
+    assert loaded == [candle]
+
+
+def test_sqlite_candle_cache_evicts_expired_entries(tmp_path: Path):
+    cache = SqliteCandleCache(cache_file=tmp_path / "candles.sqlite3", ttl_seconds=0)
+    candle = Candle(
+        symbol="TEST",
+        timeframe=Timeframe.ONE_MINUTE,
+        timestamp=datetime(2024, 1, 1, 0, 0),
+        open=Decimal("1.0"),
+        high=Decimal("1.1"),
+        low=Decimal("0.9"),
+        close=Decimal("1.05"),
+        volume=Decimal("100"),
+    )
+
+    cache.set(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=1, candles=[candle])
+    time.sleep(0.001)
+
+    assert cache.get(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=1) is None
+
+
+def test_memory_candle_cache_serves_hits_without_backend_reads(tmp_path: Path):
+    backend = CandleCache(cache_file=tmp_path / "candles.json")
+    cache = MemoryCandleCache(backend, maxsize=1)
+    candle = Candle(
+        symbol="TEST",
+        timeframe=Timeframe.ONE_MINUTE,
+        timestamp=datetime(2024, 1, 1, 0, 0),
+        open=Decimal("1.0"),
+        high=Decimal("1.1"),
+        low=Decimal("0.9"),
+        close=Decimal("1.05"),
+        volume=Decimal("100"),
+    )
+
+    cache.set(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=1, candles=[candle])
+    assert backend.get(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=1) == [candle]
+
+    (tmp_path / "candles.json").write_text("{}")
+    assert cache.get(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=1) == [candle]
+
+    # Evicted past maxsize, so the next read falls through to the (now empty) backend
+    cache.set(symbol="OTHER", timeframe=Timeframe.ONE_MINUTE, count=1, candles=[candle])
+    assert cache.get(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=1) is None
+
+
+
+def test_memory_candle_cache_defers_backend_writes_until_flush(tmp_path: Path):
+    backend = SqliteCandleCache(cache_file=tmp_path / "candles.sqlite3")
+    cache = MemoryCandleCache(backend, maxsize=1, flush_interval=60)
+    candle = Candle(
+        symbol="TEST",
+        timeframe=Timeframe.ONE_MINUTE,
+        timestamp=datetime(2024, 1, 1, 0, 0),
+        open=Decimal("1.0"),
+        high=Decimal("1.1"),
+        low=Decimal("0.9"),
+        close=Decimal("1.05"),
+        volume=Decimal("100"),
+    )
+
+    cache.set(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=1, candles=[candle])
+    cache.set(symbol="OTHER", timeframe=Timeframe.ONE_MINUTE, count=1, candles=[candle])
+    assert backend.get(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=1) is None
+    # Evicted from memory, still served from the pending writes
+    assert cache.get(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=1) == [candle]
+
+    cache.close()
+    assert backend.get(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=1) == [candle]
+    assert backend.get(symbol="OTHER", timeframe=Timeframe.ONE_MINUTE, count=1) == [candle]
+    backend.close()
+
+
+class _ReadDuringWriteBackend(SqliteCandleCache):
+    """Reads the layered cache back while each flushed entry is being written."""
+
+    cache: MemoryCandleCache
+    seen_during_write: list
+
+    def set(self, symbol: str, timeframe: Timeframe, count: int, candles: list[Candle]) -> None:
+        self.seen_during_write.append(self.cache.get(symbol=symbol, timeframe=timeframe, count=count))
+        super().set(symbol=symbol, timeframe=timeframe, count=count, candles=candles)
+
+
+def test_memory_candle_cache_serves_entries_while_they_are_flushed(tmp_path: Path):
+    backend = _ReadDuringWriteBackend(cache_file=tmp_path / "candles.sqlite3")
+    cache = MemoryCandleCache(backend, maxsize=1, flush_interval=60)
+    backend.cache, backend.seen_during_write = cache, []
+    candle = Candle(
+        symbol="TEST",
+        timeframe=Timeframe.ONE_MINUTE,
+        timestamp=datetime(2024, 1, 1, 0, 0),
+        open=Decimal("1.0"),
+        high=Decimal("1.1"),
+        low=Decimal("0.9"),
+        close=Decimal("1.05"),
+        volume=Decimal("100"),
+    )
+
+    cache.set(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=1, candles=[candle])
+    # Pushes TEST out of memory, so only the pending write still holds it
+    cache.set(symbol="OTHER", timeframe=Timeframe.ONE_MINUTE, count=1, candles=[candle])
+    cache.close()
+
+    assert backend.seen_during_write == [[candle], [candle]]
+    backend.close()
+
+def test_candle_caches_reopen_after_close(tmp_path: Path):
+    backend = SqliteCandleCache(cache_file=tmp_path / "candles.sqlite3")
+    cache = MemoryCandleCache(backend, flush_interval=60)
+    candle = Candle(
+        symbol="TEST",
+        timeframe=Timeframe.ONE_MINUTE,
+        timestamp=datetime(2024, 1, 1, 0, 0),
+        open=Decimal("1.0"),
+        high=Decimal("1.1"),
+        low=Decimal("0.9"),
+        close=Decimal("1.05"),
+        volume=Decimal("100"),
+    )
+    cache.close()
+    backend.close()
+
+    # Same order as an app shutdown followed by another startup
+    backend.open()
+    cache.start()
+    cache.set(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=1, candles=[candle])
+    assert backend.get(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=1) is None
+
+    cache.close()
+    assert backend.get(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=1) == [candle]
+    backend.close()
+
+
 class _FakeFetchLatest:
     def __init__(self, candles: list[Candle]) -> None:
         self.candles = candles
@@ -52,7 +209,7 @@ class _FakeFetchHistorical:
         return []
 
 
-def test_market_data_controller_rewrites_cache_each_request(tmp_path: Path):
+def test_market_data_controller_serves_cache_hits_without_rewriting(tmp_path: Path):
     cache_file = tmp_path / "candles.json"
     cache = CandleCache(cache_file=cache_file)
     candle = Candle(
@@ -83,4 +240,164 @@ def test_market_data_controller_rewrites_cache_each_request(tmp_path: Path):
     second_stored_at = second_cache[next(iter(second_cache))]["stored_at"]
 
     assert fetch_latest.calls == 1  # second call used cache
-    assert second_stored_at != first_stored_at  # cache rewritten on new request
+    assert second_stored_at == first_stored_at  # cache hit left the entry alone
+
+    # A new process does not know when the persisted candles were fetched
+    restarted = MarketDataController(
+        fetch_latest=fetch_latest,
+        fetch_historical=_FakeFetchHistorical(),
+        candle_cache=cache,
+    )
+    restarted.latest(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=1)
+    assert fetch_latest.calls == 2
+
+
+def test_market_data_controller_refetches_after_freshness_window(tmp_path: Path):
+    cache = CandleCache(cache_file=tmp_path / "candles.json")
+    candle = Candle(
+        symbol="TEST",
+        timeframe=Timeframe.ONE_MINUTE,
+        timestamp=datetime(2024, 1, 1, 0, 0),
+        open=Decimal("1.0"),
+        high=Decimal("1.1"),
+        low=Decimal("0.9"),
+        close=Decimal("1.05"),
+        volume=Decimal("100"),
+    )
+    fetch_latest = _FakeFetchLatest([candle])
+    controller = MarketDataController(
+        fetch_latest=fetch_latest,
+        fetch_historical=_FakeFetchHistorical(),
+        candle_cache=cache,
+        freshness_seconds={Timeframe.ONE_MINUTE: 0, Timeframe.ONE_DAY: 3600},
+    )
+
+    controller.latest(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=1)
+    time.sleep(0.001)
+    controller.latest(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=1)
+    assert fetch_latest.calls == 2  # stale after a zero-second window
+
+    controller.latest(symbol="TEST", timeframe=Timeframe.ONE_DAY, count=1)
+    controller.latest(symbol="TEST", timeframe=Timeframe.ONE_DAY, count=1)
+    assert fetch_latest.calls == 3  # served from cache within the window
+
+
+
+def test_market_data_controller_reports_remaining_freshness():
+    candle = Candle(
+        symbol="TEST",
+        timeframe=Timeframe.ONE_MINUTE,
+        timestamp=datetime(2024, 1, 1, 0, 0),
+        open=Decimal("1.0"),
+        high=Decimal("1.1"),
+        low=Decimal("0.9"),
+        close=Decimal("1.05"),
+        volume=Decimal("100"),
+    )
+    controller = MarketDataController(
+        fetch_latest=_FakeFetchLatest([candle]),
+        fetch_historical=_FakeFetchHistorical(),
+        freshness_seconds={Timeframe.ONE_MINUTE: 30},
+    )
+    assert controller.remaining_freshness("TEST", Timeframe.ONE_MINUTE, 1) == 0.0  # never fetched
+
+    controller.latest(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=1)
+    time.sleep(0.01)
+
+    assert 29 < controller.remaining_freshness("TEST", Timeframe.ONE_MINUTE, 1) < 30
+
+class _BlockingFetchLatest(_FakeFetchLatest):
+    def __init__(self, candles: list[Candle]) -> None:
+        super().__init__(candles)
+        self.release = threading.Event()
+
+    def execute(self, *args, **kwargs):
+        self.release.wait(timeout=5)
+        return super().execute(*args, **kwargs)
+
+
+def test_market_data_controller_coalesces_concurrent_fetches():
+    candle = Candle(
+        symbol="TEST",
+        timeframe=Timeframe.ONE_MINUTE,
+        timestamp=datetime(2024, 1, 1, 0, 0),
+        open=Decimal("1.0"),
+        high=Decimal("1.1"),
+        low=Decimal("0.9"),
+        close=Decimal("1.05"),
+        volume=Decimal("100"),
+    )
+    fetch_latest = _BlockingFetchLatest([candle])
+    controller = MarketDataController(fetch_latest=fetch_latest, fetch_historical=_FakeFetchHistorical())
+    results: list[list[Candle]] = []
+
+    def request() -> None:
+        results.append(controller.latest(symbol="TEST", timeframe=Timeframe.ONE_MINUTE, count=1))
+
+    threads = [threading.Thread(target=request) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    fetch_latest.release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert fetch_latest.calls == 1
+    assert results == [[candle]] * 5
+    assert len({id(result) for result in results}) == 5  # each caller owns its list
+
+
+class _MultiSymbolFetchLatest:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+        self.single_calls: list[str] = []
+
+    def execute(self, symbol: str, timeframe: Timeframe, count: int = 1):
+        self.single_calls.append(symbol)
+        return [_candle_for(symbol, timeframe)]
+
+    def execute_many(self, symbols, timeframe: Timeframe, count: int = 1):
+        symbols = list(symbols)
+        self.batches.append(symbols)
+        return {symbol: [_candle_for(symbol, timeframe)] for symbol in symbols if symbol != "MISSING"}
+
+
+def _candle_for(symbol: str, timeframe: Timeframe) -> Candle:
+    return Candle(
+        symbol=symbol,
+        timeframe=timeframe,
+        timestamp=datetime(2024, 1, 1, 0, 0),
+        open=Decimal("1.0"),
+        high=Decimal("1.1"),
+        low=Decimal("0.9"),
+        close=Decimal("1.05"),
+        volume=Decimal("100"),
+    )
+
+
+def test_market_data_controller_batches_symbols_into_one_fetch():
+    fetch_latest = _MultiSymbolFetchLatest()
+    controller = MarketDataController(
+        fetch_latest=fetch_latest,
+        fetch_historical=_FakeFetchHistorical(),
+        symbol_batcher=SymbolBatcher(fetch_latest, window_seconds=0.05),
+    )
+    results: dict[str, list[Candle]] = {}
+
+    def request(symbol: str) -> None:
+        results[symbol] = controller.latest(symbol=symbol, timeframe=Timeframe.ONE_MINUTE, count=1)
+
+    threads = [threading.Thread(target=request, args=(symbol,)) for symbol in ("AAA", "BBB", "MISSING")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(fetch_latest.batches) == 1
+    assert sorted(fetch_latest.batches[0]) == ["AAA", "BBB", "MISSING"]
+    assert fetch_latest.single_calls == ["MISSING"]  # left out of the batch, fetched alone
+    assert {symbol: candles[0].symbol for symbol, candles in results.items()} == {
+        "AAA": "AAA",
+        "BBB": "BBB",
+        "MISSING": "MISSING",
+    }
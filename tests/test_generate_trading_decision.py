@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from application.use_cases.generate_trading_decision import GenerateTradingDecision
+from domain.entities.candle import Candle
+from domain.services.trend_detector import SwingSettings, TrendDetector
+from domain.value_objects.timeframe import Timeframe
+
+
+class _FixedFetchLatest:
+    def __init__(self, candles: list[Candle]) -> None:
+        self.candles = candles
+
+    def execute(self, *args, **kwargs):
+        return list(self.candles)
+
+
+def test_each_execution_uses_a_fresh_trend_detector():
+    start = datetime(2024, 1, 1)
+    rows = [
+        ("100", "101", "99", "100"),
+        ("101", "105", "100", "104"),
+        ("103", "103", "97", "98"),
+        ("99", "110", "104", "109"),
+        ("105", "108", "102", "103"),
+        ("104", "120", "107", "118"),
+    ]
+    candles = [
+        Candle(
+            symbol="TEST",
+            timeframe=Timeframe.ONE_MINUTE,
+            timestamp=start + timedelta(minutes=idx),
+            open=Decimal(o),
+            high=Decimal(h),
+            low=Decimal(l),
+            close=Decimal(c),
+            volume=Decimal("1000"),
+        )
+        for idx, (o, h, l, c) in enumerate(rows)
+    ]
+    detectors: list[TrendDetector] = []
+
+    def factory() -> TrendDetector:
+        detectors.append(TrendDetector(SwingSettings(min_percent_move=Decimal("0.01"))))
+        return detectors[-1]
+
+    use_case = GenerateTradingDecision(fetch_latest=_FixedFetchLatest(candles), trend_detector_factory=factory)
+
+    first = use_case.execute(symbol="TEST", timeframe=Timeframe.ONE_MINUTE)
+    second = use_case.execute(symbol="TEST", timeframe=Timeframe.ONE_MINUTE)
+
+    assert len(detectors) == 2 and detectors[0] is not detectors[1]
+    assert first == second  # no swings carried over from the first run
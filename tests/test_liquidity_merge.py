@@ -2,23 +2,18 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 from decimal import Decimal
+from itertools import accumulate, repeat
 
-from domain.entities.candle import Candle
 from domain.indicators.liquidity import LiquidityIndicator, LiquidityIndicatorSettings
-from domain.value_objects.timeframe import Timeframe
-
-
-def _build_candle(ts: datetime, low: str, high: str, close: str) -> Candle:
-    return Candle(
-        symbol="TEST",
-        timeframe=Timeframe.ONE_MINUTE,
-        timestamp=ts,
-        open=Decimal(close),
-        high=Decimal(high),
-        low=Decimal(low),
-        close=Decimal(close),
-        volume=Decimal("1"),
-    )
+from tests._liquidity_helpers import build_candle as _build_candle
+
+
+_ONE_MINUTE = timedelta(minutes=1)
+
+
+def _minutes_from(start: datetime, count: int) -> list[datetime]:
+    """Return count timestamps one minute apart, beginning at start."""
+    return list(accumulate(repeat(_ONE_MINUTE, count - 1), initial=start))
 
 
 def test_adjacent_zones_merge_into_single_region():
@@ -37,18 +32,13 @@ def test_adjacent_zones_merge_into_single_region():
     indicator = LiquidityIndicator(settings=settings)
 
     start = datetime(2024, 1, 1, 0, 0)
-    candles: list[Candle] = []
 
     # First tight range
-    for i in range(6):
-        ts = start + timedelta(minutes=i)
-        candles.append(_build_candle(ts, "99", "101", "100"))
+    candles = [_build_candle(ts, "99", "101", "100") for ts in _minutes_from(start, 6)]
 
     # Small gap then another tight range with overlapping prices
-    gap_ts = start + timedelta(minutes=7)
-    for i in range(6):
-        ts = gap_ts + timedelta(minutes=i)
-        candles.append(_build_candle(ts, "98.8", "101.2", "100"))
+    gap_ts = start + 7 * _ONE_MINUTE
+    candles.extend(_build_candle(ts, "98.8", "101.2", "100") for ts in _minutes_from(gap_ts, 6))
 
     signal = indicator.analyze(candles)
 
@@ -2,47 +2,59 @@ from __future__ import annotations
 
 from decimal import Decimal
 
-from infrastructure.config.liquidity import load_liquidity_settings
+import pytest
 
+from infrastructure.config.liquidity import load_liquidity_settings
 
-def test_load_liquidity_settings_defaults(monkeypatch):
-    for key in (
-        "ACCUMULATION_MIN_CANDLES",
-        "ACCUMULATION_MAX_RANGE_PERCENT",
-        "ACCUMULATION_MIN_STRENGTH",
-        "ACCUMULATION_MIN_BOUNDARY_TOUCHES",
-        "ACCUMULATION_MAX_ZONES",
-        "ACCUMULATION_MIN_GAP_BETWEEN_ZONES",
-        "ACCUMULATION_SAFE_ZONE_PERCENT",
-    ):
+# Every variable read by load_liquidity_settings; add new settings keys here
+_LIQUIDITY_ENV_KEYS = (
+    "ACCUMULATION_MIN_CANDLES",
+    "ACCUMULATION_MAX_RANGE_PERCENT",
+    "ACCUMULATION_MIN_STRENGTH",
+    "ACCUMULATION_MIN_BOUNDARY_TOUCHES",
+    "ACCUMULATION_MAX_ZONES",
+    "ACCUMULATION_MIN_GAP_BETWEEN_ZONES",
+    "ACCUMULATION_SAFE_ZONE_PERCENT",
+)
+
+
+@pytest.mark.parametrize(
+    ("env", "expected"),
+    [
+        (
+            {},
+            {
+                "min_candles_in_zone": 25,
+                "max_range_percent": Decimal("0.8"),
+                "min_strength": 0.55,
+                "min_boundary_touches": 3,
+                "max_zones": 5,
+                "min_gap_between_zones": 15,
+                "safe_zone_percent": Decimal("1"),
+            },
+        ),
+        (
+            dict(zip(_LIQUIDITY_ENV_KEYS, ("30", "1.2", "0.6", "4", "7", "20", "2.5"), strict=True)),
+            {
+                "min_candles_in_zone": 30,
+                "max_range_percent": Decimal("1.2"),
+                "min_strength": 0.6,
+                "min_boundary_touches": 4,
+                "max_zones": 7,
+                "min_gap_between_zones": 20,
+                "safe_zone_percent": Decimal("2.5"),
+            },
+        ),
+    ],
+    ids=["defaults", "overrides"],
+)
+def test_load_liquidity_settings(monkeypatch, env, expected):
+    for key in _LIQUIDITY_ENV_KEYS:
         monkeypatch.delenv(key, raising=False)
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
 
     settings = load_liquidity_settings()
 
-    assert settings.min_candles_in_zone == 25
-    assert settings.max_range_percent == Decimal("0.8")
-    assert settings.min_strength == 0.55
-    assert settings.min_boundary_touches == 3
-    assert settings.max_zones == 5
-    assert settings.min_gap_between_zones == 15
-    assert settings.safe_zone_percent == Decimal("1")
-
-
-def test_load_liquidity_settings_overrides(monkeypatch):
-    monkeypatch.setenv("ACCUMULATION_MIN_CANDLES", "30")
-    monkeypatch.setenv("ACCUMULATION_MAX_RANGE_PERCENT", "1.2")
-    monkeypatch.setenv("ACCUMULATION_MIN_STRENGTH", "0.6")
-    monkeypatch.setenv("ACCUMULATION_MIN_BOUNDARY_TOUCHES", "4")
-    monkeypatch.setenv("ACCUMULATION_MAX_ZONES", "7")
-    monkeypatch.setenv("ACCUMULATION_MIN_GAP_BETWEEN_ZONES", "20")
-    monkeypatch.setenv("ACCUMULATION_SAFE_ZONE_PERCENT", "2.5")
-
-    settings = load_liquidity_settings()
-
-    assert settings.min_candles_in_zone == 30
-    assert settings.max_range_percent == Decimal("1.2")
-    assert settings.min_strength == 0.6
-    assert settings.min_boundary_touches == 4
-    assert settings.max_zones == 7
-    assert settings.min_gap_between_zones == 20
-    assert settings.safe_zone_percent == Decimal("2.5")
+    for attribute, value in expected.items():
+        assert getattr(settings, attribute) == value, attribute
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import pytest
+
+from infrastructure.config.settings import load_settings
+
+
+@pytest.mark.parametrize("value", ["0", "-4", "many"])
+def test_load_settings_rejects_invalid_worker_threads(monkeypatch: pytest.MonkeyPatch, value: str) -> None:
+    monkeypatch.setenv("API_WORKER_THREADS", value)
+
+    with pytest.raises(ValueError, match=f"Invalid API_WORKER_THREADS value: {value}"):
+        load_settings()
+
+
+def test_load_settings_reads_worker_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("API_WORKER_THREADS", "8")
+
+    assert load_settings().worker_threads == 8
@@ -0,0 +1,23 @@
+from domain import value_objects
+from domain.value_objects.timeframe import Timeframe
+
+
+def test_timeframe_members_match_supported_intervals() -> None:
+    assert {tf.value for tf in Timeframe} == {
+        "1min",
+        "5min",
+        "15min",
+        "30min",
+        "45min",
+        "1h",
+        "2h",
+        "4h",
+        "8h",
+        "1day",
+        "1week",
+        "1month",
+    }
+
+
+def test_package_exports_the_single_timeframe_enum() -> None:
+    assert value_objects.Timeframe is Timeframe
@@ -9,6 +9,11 @@ from domain.value_objects.timeframe import Timeframe
 from domain.value_objects.trend import SwingType, TrendDirection
 
 
+# Fixed start time keeps the candles identical from run to run
+_BASE_TIME = datetime(2024, 1, 1)
+_VOLUME = Decimal("1000")
+
+
 def make_candle(base_time: datetime, idx: int, open_: str, high: str, low: str, close: str) -> Candle:
     return Candle(
         symbol="TEST",
@@ -18,20 +23,27 @@ def make_candle(base_time: datetime, idx: int, open_: str, high: str, low: str,
         high=Decimal(high),
         low=Decimal(low),
         close=Decimal(close),
-        volume=Decimal("1000"),
+        volume=_VOLUME,
     )
 
 
+def make_candles(base_time: datetime, rows: list[tuple[str, str, str, str]]) -> list[Candle]:
+    """Build one-minute candles from (open, high, low, close) rows."""
+    return [make_candle(base_time, idx, *row) for idx, row in enumerate(rows)]
+
+
 def test_uptrend_detects_higher_high_and_higher_low():
-    base_time = datetime.utcnow()
-    candles = [
-        make_candle(base_time, 0, "100", "101", "99", "100"),
-        make_candle(base_time, 1, "101", "105", "100", "104"),
-        make_candle(base_time, 2, "103", "103", "97", "98"),
-        make_candle(base_time, 3, "99", "110", "104", "109"),
-        make_candle(base_time, 4, "105", "108", "102", "103"),
-        make_candle(base_time, 5, "104", "120", "107", "118"),
-    ]
+    candles = make_candles(
+        _BASE_TIME,
+        [
+            ("100", "101", "99", "100"),
+            ("101", "105", "100", "104"),
+            ("103", "103", "97", "98"),
+            ("99", "110", "104", "109"),
+            ("105", "108", "102", "103"),
+            ("104", "120", "107", "118"),
+        ],
+    )
 
     detector = TrendDetector(SwingSettings(min_percent_move=Decimal("0.01")))
     result = detector.analyze(candles)
@@ -44,15 +56,17 @@ def test_uptrend_detects_higher_high_and_higher_low():
 
 
 def test_downtrend_detects_lower_high_and_lower_low():
-    base_time = datetime.utcnow()
-    candles = [
-        make_candle(base_time, 0, "120", "121", "118", "119"),
-        make_candle(base_time, 1, "119", "119", "112", "113"),
-        make_candle(base_time, 2, "113", "114", "109", "110"),
-        make_candle(base_time, 3, "110", "110", "102", "103"),
-        make_candle(base_time, 4, "103", "104", "95", "96"),
-        make_candle(base_time, 5, "95", "97", "90", "91"),
-    ]
+    candles = make_candles(
+        _BASE_TIME,
+        [
+            ("120", "121", "118", "119"),
+            ("119", "119", "112", "113"),
+            ("113", "114", "109", "110"),
+            ("110", "110", "102", "103"),
+            ("103", "104", "95", "96"),
+            ("95", "97", "90", "91"),
+        ],
+    )
 
     detector = TrendDetector(SwingSettings(min_percent_move=Decimal("0.01")))
     result = detector.analyze(candles)
@@ -62,13 +76,15 @@ def test_downtrend_detects_lower_high_and_lower_low():
 
 
 def test_noise_is_filtered_and_trend_is_undefined():
-    base_time = datetime.utcnow()
-    candles = [
-        make_candle(base_time, 0, "100", "101", "99", "100"),
-        make_candle(base_time, 1, "100", "101.1", "99.5", "100.5"),
-        make_candle(base_time, 2, "100", "101.2", "99.6", "100.4"),
-        make_candle(base_time, 3, "100", "101.15", "99.4", "100.2"),
-    ]
+    candles = make_candles(
+        _BASE_TIME,
+        [
+            ("100", "101", "99", "100"),
+            ("100", "101.1", "99.5", "100.5"),
+            ("100", "101.2", "99.6", "100.4"),
+            ("100", "101.15", "99.4", "100.2"),
+        ],
+    )
 
     detector = TrendDetector(SwingSettings(min_percent_move=Decimal("0.05")))
     result = detector.analyze(candles)
@@ -77,3 +93,9 @@ def test_noise_is_filtered_and_trend_is_undefined():
     assert result.confidence <= 0.25
     assert result.last_swings == []
     assert "undefined" in result.reason.lower()
+
+
+@pytest.mark.parametrize("max_swings", [0, -1])
+def test_swing_settings_rejects_non_positive_max_swings(max_swings):
+    with pytest.raises(ValueError, match="max_swings must be greater than zero"):
+        SwingSettings(max_swings=max_swings)
@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from domain.entities.candle import Candle
+from domain.indicators.trend import SwingClassification, TrendIndicator
+from domain.indicators.trend.trend_indicator import TrendIndicatorSettings
+from domain.value_objects.timeframe import Timeframe
+
+
+def make_candle(base_time: datetime, idx: int, high: str, low: str, close: str) -> Candle:
+    return Candle(
+        symbol="TEST",
+        timeframe=Timeframe.ONE_MINUTE,
+        timestamp=base_time + timedelta(minutes=idx),
+        open=Decimal(close),
+        high=Decimal(high),
+        low=Decimal(low),
+        close=Decimal(close),
+        volume=Decimal("1000"),
+    )
+
+
+def _rising_zigzag() -> list[Candle]:
+    base_time = datetime(2024, 1, 1)
+    prices = [
+        ("101", "99", "100"),
+        ("104", "100", "103"),
+        ("102", "98", "99"),
+        ("107", "101", "106"),
+        ("105", "100", "101"),
+        ("110", "103", "109"),
+        ("108", "102", "103"),
+        ("113", "106", "112"),
+        ("111", "105", "106"),
+        ("117", "109", "116"),
+        ("115", "108", "110"),
+        ("121", "113", "120"),
+    ]
+    return [make_candle(base_time, idx, *ohlc) for idx, ohlc in enumerate(prices)]
+
+
+def test_analyze_detects_higher_highs_and_higher_lows():
+    indicator = TrendIndicator(TrendIndicatorSettings(lookback_bars=1))
+
+    signal = indicator.analyze(_rising_zigzag())
+
+    classifications = {s.classification for s in signal.swings}
+    assert SwingClassification.HIGHER_HIGH in classifications
+    assert SwingClassification.HIGHER_LOW in classifications
+    assert signal.is_bullish
+
+
+def test_analyze_is_repeatable_on_same_instance():
+    indicator = TrendIndicator(TrendIndicatorSettings(lookback_bars=1))
+    candles = _rising_zigzag()
+
+    first = indicator.analyze(candles)
+    second = indicator.analyze(candles)
+
+    assert first == second
+
+
+def test_streaming_update_matches_full_analysis():
+    candles = _rising_zigzag()
+    settings = TrendIndicatorSettings(lookback_bars=1)
+
+    streaming = TrendIndicator(settings)
+    for candle in candles:
+        streamed = streaming.update(candle)
+
+    full = TrendIndicator(settings).analyze(candles)
+
+    assert streamed.swings == full.swings
+    assert streamed.trend == full.trend
+
+
+def test_update_continues_from_batch_analysis():
+    candles = _rising_zigzag()
+    settings = TrendIndicatorSettings(lookback_bars=1)
+
+    indicator = TrendIndicator(settings)
+    indicator.analyze(candles[:6])
+    for candle in candles[6:]:
+        continued = indicator.update(candle)
+
+    full = TrendIndicator(settings).analyze(candles)
+
+    assert continued.swings == full.swings
+    assert continued.trend == full.trend
+
+
+def test_update_reports_bos_only_for_the_latest_close():
+    base_time = datetime(2024, 1, 1)
+    closes = [100, 104, 99, 108, 101, 112, 103, 116, 105, 104, 103, 120, 119, 118, 97, 98]
+    candles = [
+        make_candle(base_time, idx, str(close + 1), str(close - 1), str(close))
+        for idx, close in enumerate(closes)
+    ]
+    settings = TrendIndicatorSettings(lookback_bars=1)
+
+    streaming = TrendIndicator(settings)
+    for n, candle in enumerate(candles, start=1):
+        streamed = streaming.update(candle)
+        full = TrendIndicator(settings).analyze(candles[:n])
+
+        assert streamed.last_bos == full.last_bos, f"bar {n - 1}"
+        assert streamed.confidence == full.confidence, f"bar {n - 1}"
+        assert streamed.trend == full.trend, f"bar {n - 1}"
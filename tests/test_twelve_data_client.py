@@ -1,35 +1,20 @@
+import threading
 from datetime import datetime
 from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import MappingProxyType
+from typing import Mapping
 
 import pytest
 
 from domain.exceptions.errors import DataProviderError
 from domain.value_objects.timeframe import Timeframe
-from infrastructure.data_providers.twelve_data_client import TwelveDataClient
+from infrastructure.data_providers.twelve_data_client import TwelveDataClient, UrlLibSession
 
 
-class MockResponse:
-    def __init__(self, payload: dict, status_code: int = 200) -> None:
-        self._payload = payload
-        self.status_code = status_code
-        self.text = "mock response"
-
-    def json(self) -> dict:
-        return self._payload
-
-
-class MockSession:
-    def __init__(self, response: MockResponse) -> None:
-        self.response = response
-        self.calls: list[dict] = []
-
-    def get(self, url: str, params: dict | None = None, timeout: int | None = None) -> MockResponse:
-        self.calls.append({"url": url, "params": params, "timeout": timeout})
-        return self.response
-
-
-def test_get_latest_ohlcv_returns_candles() -> None:
-    payload = {
+# Payloads shared by several tests, wrapped read-only so no test can rewrite them for the next
+_SINGLE_CANDLE_PAYLOAD = MappingProxyType(
+    {
         "values": [
             {
                 "datetime": "2024-01-01 00:00:00",
@@ -38,7 +23,15 @@ def test_get_latest_ohlcv_returns_candles() -> None:
                 "low": "90.0",
                 "close": "105.0",
                 "volume": "1500",
-            },
+            }
+        ]
+    }
+)
+
+_LATEST_PAYLOAD = MappingProxyType(
+    {
+        "values": [
+            *_SINGLE_CANDLE_PAYLOAD["values"],
             {
                 "datetime": "2023-12-31 23:59:00",
                 "open": "95.0",
@@ -49,8 +42,39 @@ def test_get_latest_ohlcv_returns_candles() -> None:
             },
         ]
     }
-    session = MockSession(MockResponse(payload))
-    client = TwelveDataClient(api_key="fake", session=session, base_url="http://mock")
+)
+
+
+class MockResponse:
+    text = "mock response"
+
+    def __init__(self, payload: Mapping, status_code: int = 200) -> None:
+        # Wrapped once so every json() call hands out the same read-only view
+        self._payload = payload if isinstance(payload, MappingProxyType) else MappingProxyType(payload)
+        self.status_code = status_code
+
+    def json(self) -> Mapping:
+        return self._payload
+
+
+class MockSession:
+    def __init__(self, response: MockResponse) -> None:
+        self.response = response
+        self.calls: list[dict] = []
+
+    def get(self, url: str, params: dict | None = None, timeout: int | None = None) -> MockResponse:
+        self.calls.append({"url": url, "params": params, "timeout": timeout})
+        return self.response
+
+
+def _mock_client(session, **kwargs) -> TwelveDataClient:
+    """Build a client over a fake session; each test gets its own, since clients remember payloads."""
+    return TwelveDataClient(api_key="fake", session=session, base_url="http://mock", **kwargs)
+
+
+def test_get_latest_ohlcv_returns_candles() -> None:
+    session = MockSession(MockResponse(_LATEST_PAYLOAD))
+    client = _mock_client(session)
 
     candles = client.get_latest_ohlcv("AAPL", Timeframe.ONE_MINUTE, count=2)
 
@@ -62,20 +86,8 @@ def test_get_latest_ohlcv_returns_candles() -> None:
 
 
 def test_get_historical_ohlcv_applies_date_filters() -> None:
-    payload = {
-        "values": [
-            {
-                "datetime": "2024-01-01 00:00:00",
-                "open": "100.0",
-                "high": "110.0",
-                "low": "90.0",
-                "close": "105.0",
-                "volume": "1500",
-            }
-        ]
-    }
-    session = MockSession(MockResponse(payload))
-    client = TwelveDataClient(api_key="fake", session=session, base_url="http://mock")
+    session = MockSession(MockResponse(_SINGLE_CANDLE_PAYLOAD))
+    client = _mock_client(session)
 
     start = datetime(2023, 12, 31, 0, 0, 0)
     end = datetime(2024, 1, 2, 0, 0, 0)
@@ -95,17 +107,206 @@ def test_get_historical_ohlcv_applies_date_filters() -> None:
     assert params["interval"] == Timeframe.FIFTEEN_MINUTES.value
 
 
-def test_get_latest_ohlcv_handles_http_error() -> None:
-    session = MockSession(MockResponse({"message": "bad request"}, status_code=400))
-    client = TwelveDataClient(api_key="fake", session=session, base_url="http://mock")
+@pytest.mark.parametrize(
+    ("payload", "status_code", "message"),
+    [
+        ({"message": "bad request"}, 400, r"HTTP 400"),
+        ({"unexpected": "payload"}, 200, r"missing 'values'"),
+    ],
+    ids=["http_error", "invalid_payload"],
+)
+def test_get_latest_ohlcv_raises_data_provider_error(payload: dict, status_code: int, message: str) -> None:
+    session = MockSession(MockResponse(payload, status_code=status_code))
+    client = _mock_client(session)
 
-    with pytest.raises(DataProviderError):
+    with pytest.raises(DataProviderError, match=message):
         client.get_latest_ohlcv("AAPL", Timeframe.ONE_MINUTE, count=1)
 
 
-def test_get_latest_ohlcv_handles_invalid_payload() -> None:
-    session = MockSession(MockResponse({"unexpected": "payload"}))
-    client = TwelveDataClient(api_key="fake", session=session, base_url="http://mock")
+class _CountingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    peers: set = set()
 
-    with pytest.raises(DataProviderError):
-        client.get_latest_ohlcv("AAPL", Timeframe.ONE_MINUTE, count=1)
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        type(self).peers.add(self.client_address)
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def test_urllib_session_reuses_keep_alive_connection() -> None:
+    _CountingHandler.peers = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CountingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    session = UrlLibSession()
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/time_series"
+        first = session.get(url, params={"symbol": "AAPL"}, timeout=5)
+        second = session.get(url, params={"symbol": "MSFT"}, timeout=5)
+    finally:
+        session.close()
+        server.shutdown()
+        server.server_close()
+
+    assert first.status_code == second.status_code == 200
+    assert second.json() == {"ok": True}
+    assert len(_CountingHandler.peers) == 1
+
+
+class _RedirectingHandler(_CountingHandler):
+    paths: list = []
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        type(self).paths.append(self.path)
+        if "/old?" in self.path:
+            self.send_response(302)
+            self.send_header("Location", "/time_series?symbol=AAPL")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        super().do_GET()
+
+
+@pytest.mark.parametrize("via_proxy", [False, True], ids=["direct", "proxy"])
+def test_urllib_session_follows_redirects_and_proxies(via_proxy: bool) -> None:
+    _RedirectingHandler.paths = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RedirectingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    local = f"http://127.0.0.1:{server.server_port}"
+    # The local server stands in for a forward proxy in front of an unreachable host
+    origin = "http://api.example.invalid" if via_proxy else local
+    session = UrlLibSession(proxies={"http": local} if via_proxy else {})
+    try:
+        response = session.get(f"{origin}/old", params={"symbol": "AAPL"}, timeout=5)
+    finally:
+        session.close()
+        server.shutdown()
+        server.server_close()
+
+    prefix = origin if via_proxy else ""
+    assert response.status_code == 200
+    assert _RedirectingHandler.paths == [f"{prefix}/old?symbol=AAPL", f"{prefix}/time_series?symbol=AAPL"]
+
+
+def test_urllib_session_bypasses_proxy_for_no_proxy_hosts() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CountingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    # Nothing listens on port 9, so the request only succeeds if the proxy is skipped
+    session = UrlLibSession(proxies={"http": "http://127.0.0.1:9", "no": "127.0.0.1"}, max_retries=0)
+    try:
+        response = session.get(f"http://127.0.0.1:{server.server_port}/time_series", timeout=5)
+    finally:
+        session.close()
+        server.shutdown()
+        server.server_close()
+
+    assert response.status_code == 200
+
+
+class _ConditionalSession:
+    def __init__(self, payload: Mapping) -> None:
+        self.payload = payload
+        self.sent_headers: list[dict | None] = []
+
+    def get(self, url: str, params: dict | None = None, timeout: int | None = None, headers: dict | None = None):
+        self.sent_headers.append(headers)
+        if headers and headers.get("If-None-Match") == '"v1"':
+            response = MockResponse({}, status_code=304)
+        else:
+            response = MockResponse(self.payload)
+        response.headers = {"ETag": '"v1"'}
+        return response
+
+
+def test_get_latest_ohlcv_reuses_payload_on_not_modified() -> None:
+    session = _ConditionalSession(_SINGLE_CANDLE_PAYLOAD)
+    client = _mock_client(session)
+
+    first = client.get_latest_ohlcv("AAPL", Timeframe.ONE_DAY, count=1)
+    second = client.get_latest_ohlcv("AAPL", Timeframe.ONE_DAY, count=1)
+
+    assert session.sent_headers == [None, {"If-None-Match": '"v1"'}]
+    assert second == first
+
+
+class _FlakyHandler(_CountingHandler):
+    failures_left = 0
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        if type(self).failures_left > 0:
+            type(self).failures_left -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        super().do_GET()
+
+
+def test_urllib_session_retries_transient_statuses() -> None:
+    _FlakyHandler.failures_left = 2
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FlakyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    session = UrlLibSession(backoff_factor=0)
+    try:
+        response = session.get(f"http://127.0.0.1:{server.server_port}/time_series", timeout=5)
+    finally:
+        session.close()
+        server.shutdown()
+        server.server_close()
+
+    assert response.status_code == 200
+    assert _FlakyHandler.failures_left == 0
+
+
+class _PerSymbolSession:
+    def __init__(self) -> None:
+        self.symbols: list[str] = []
+        self._lock = threading.Lock()
+
+    def get(self, url: str, params: dict | None = None, timeout: int | None = None) -> MockResponse:
+        with self._lock:
+            self.symbols.append(params["symbol"])
+        price = str(len(params["symbol"]))
+        entry = {"datetime": "2024-01-01 00:00:00", "open": price, "high": price, "low": price, "close": price}
+        return MockResponse({"values": [entry]})
+
+
+def test_get_many_historical_ohlcv_fetches_each_symbol() -> None:
+    session = _PerSymbolSession()
+    client = _mock_client(session, max_concurrency=2)
+
+    results = client.get_many_historical_ohlcv(["A", "BBB", "CC", "A"], Timeframe.ONE_HOUR, limit=1)
+
+    assert list(results) == ["A", "BBB", "CC"]
+    assert [series[0].close for series in results.values()] == [Decimal("1"), Decimal("3"), Decimal("2")]
+    assert results["BBB"][0].timeframe is Timeframe.ONE_HOUR
+    assert sorted(session.symbols) == ["A", "BBB", "CC"]
+
+def test_get_many_latest_ohlcv_splits_multi_symbol_payload() -> None:
+    entry = {"datetime": "2024-01-01 00:00:00", "open": "1", "high": "2", "low": "0.5", "close": "1.5"}
+    payload = {
+        "AAPL": {"meta": {"symbol": "AAPL"}, "values": [entry], "status": "ok"},
+        "MSFT": {"meta": {"symbol": "MSFT"}, "values": [entry, entry], "status": "ok"},
+        "BAD": {"code": 400, "message": "symbol not found", "status": "error"},
+    }
+    session = MockSession(MockResponse(payload))
+    client = _mock_client(session)
+
+    results = client.get_many_latest_ohlcv(["AAPL", "MSFT", "AAPL", "BAD"], Timeframe.ONE_HOUR, count=2)
+
+    assert len(session.calls) == 1
+    assert session.calls[0]["params"]["symbol"] == "AAPL,MSFT,BAD"
+    assert sorted(results) == ["AAPL", "MSFT"]
+    assert len(results["MSFT"]) == 2
+    assert results["AAPL"][0].symbol == "AAPL"
+    assert results["AAPL"][0].timeframe is Timeframe.ONE_HOUR